@@ -0,0 +1,197 @@
+from typing import Iterable, Tuple
+
+# 6-bit ASCII value for each character as per ITU-R M.1371: '@' and above
+# map to 0-63, control characters become spaces. Only the ASCII half is ever
+# used, but bytes.translate() requires a full 256 entry table.
+_SIXBIT_TABLE = bytes(c - 64 if c >= 64 else c if c >= 32 else 32 for c in range(256))
+
+
+def encode_sixbit_text(text: str, length: int) -> int:
+    """Pack text, truncated or space padded to length characters, into 6-bit ASCII"""
+    value = 0
+    padded = text[:length].ljust(length)
+    for sixbit in padded.encode("ascii").translate(_SIXBIT_TABLE):
+        value = (value << 6) | sixbit
+    return value
+
+
+def pack_fields(fields: Iterable[Tuple[int, int]]) -> Tuple[int, int]:
+    """
+    Pack binary message fields, first field most significant.
+
+    Signed values are masked to their width, which leaves them in two's
+    complement as AIS expects.
+
+    Args:
+        fields: (width in bits, value) pairs in message order
+
+    Returns:
+        Tuple[int, int]: (message bits as an unsigned integer, number of bits)
+    """
+    acc = 0
+    nbits = 0
+    for width, value in fields:
+        acc = (acc << width) | (value & ((1 << width) - 1))
+        nbits += width
+    return acc, nbits
+
+
+# AIVDM payload armoring: 6-bit values 0-39 map to '0'-'W', 40-63 to '`'-'w'
+_ARMOR_TABLE = bytes(v + 48 if v < 40 else v + 56 for v in range(64))
+# Armored character pair for every 12-bit value, so each lookup emits two
+# payload characters and the shift loop runs half as many times
+_ARMOR_PAIRS = [
+    chr(_ARMOR_TABLE[v >> 6]) + chr(_ARMOR_TABLE[v & 0x3F]) for v in range(4096)
+]
+
+
+def encode_payload(acc: int, nbits: int) -> str:
+    """
+    Armor an nbits wide binary message into a 6-bit ASCII payload.
+
+    Args:
+        acc: Message bits as an unsigned integer, first bit most significant
+        nbits: Number of bits in the message
+
+    Returns:
+        str: AIVDM payload, zero padded to a multiple of 6 bits
+    """
+    # Pad to whole character pairs, then drop the extra character if the
+    # zero padding only needed one
+    pad = -nbits % 12
+    acc <<= pad
+    payload = "".join(
+        [
+            _ARMOR_PAIRS[(acc >> shift) & 0xFFF]
+            for shift in range(nbits + pad - 12, -1, -12)
+        ]
+    )
+    return payload[: (nbits + 5) // 6]
+
+
+# Message type 1 and repeat indicator 0 of a position report, positioned
+# above the 30-bit MMSI that follows them
+_POSITION_REPORT_HEADER = pack_fields(((6, 1), (2, 0)))[0] << 30
+
+# Destination field of the static data message, which is always left blank
+_BLANK_DESTINATION = encode_sixbit_text("", 20)
+
+
+def encode_position_report(
+    mmsi: int,
+    navigation_status: int,
+    rot: int,
+    speed: int,
+    lon: int,
+    lat: int,
+    course: int,
+    heading: int,
+    timestamp: int,
+) -> str:
+    """
+    Encode a Position Report (Message Type 1) payload from AIS field values.
+
+    Args:
+        mmsi: Maritime Mobile Service Identity
+        navigation_status: AIS navigation status code
+        rot: Encoded rate of turn indicator (-128 to 127)
+        speed: Speed over ground in 0.1 knot steps (0-1023)
+        lon: Longitude in 1/10000 minute, 28-bit signed
+        lat: Latitude in 1/10000 minute, 27-bit signed
+        course: Course over ground in 0.1 degree steps
+        heading: True heading in degrees
+        timestamp: UTC second of the report (0-59)
+
+    Returns:
+        str: AIVDM payload
+    """
+    fields = (
+        # Message Type (6 bits), Repeat Indicator (2 bits) and MMSI (30 bits)
+        (38, _POSITION_REPORT_HEADER | mmsi),
+        # Navigation Status (4 bits)
+        (4, navigation_status),
+        # Rate of Turn (8 bits, signed)
+        (8, rot),
+        # Speed Over Ground (10 bits) - in 0.1 knot steps
+        (10, speed),
+        # Position Accuracy (1 bit) - 0 = low, 1 = high
+        (1, 0),
+        # Longitude (28 bits, signed) - in 1/10000 minute
+        (28, lon),
+        # Latitude (27 bits, signed) - in 1/10000 minute
+        (27, lat),
+        # Course Over Ground (12 bits) - in 0.1 degree steps
+        (12, course),
+        # True Heading (9 bits)
+        (9, heading),
+        # Time Stamp (6 bits) - seconds of UTC timestamp
+        (6, timestamp),
+        # Reserved (4 bits)
+        (4, 0),
+    )
+    return encode_payload(*pack_fields(fields))
+
+
+def encode_static_data(
+    mmsi: int,
+    call_sign: str,
+    vessel_name: str,
+    ship_type: int,
+    to_bow: int,
+    to_stern: int,
+    to_port: int,
+    to_starboard: int,
+    draft: int,
+) -> str:
+    """
+    Encode a Static and Voyage Related Data (Message Type 5) payload.
+
+    Args:
+        mmsi: Maritime Mobile Service Identity
+        call_sign: Radio call sign, up to 7 characters
+        vessel_name: Vessel name, up to 20 characters
+        ship_type: Type of ship according to AIS specifications
+        to_bow: Distance from reference point to bow in meters
+        to_stern: Distance from reference point to stern in meters
+        to_port: Distance from reference point to port in meters
+        to_starboard: Distance from reference point to starboard in meters
+        draft: Draft in 0.1 meter steps
+
+    Returns:
+        str: AIVDM payload
+    """
+    fields = (
+        # Message Type (6 bits) - Type 5
+        (6, 5),
+        # Repeat Indicator (2 bits)
+        (2, 0),
+        # MMSI (30 bits)
+        (30, mmsi),
+        # AIS Version (2 bits)
+        (2, 0),
+        # IMO Number (30 bits) - Using 0 for this example
+        (30, 0),
+        # Call Sign (42 bits) - 7 six-bit characters
+        (42, encode_sixbit_text(call_sign, 7)),
+        # Vessel Name (120 bits) - 20 six-bit characters
+        (120, encode_sixbit_text(vessel_name, 20)),
+        # Ship Type (8 bits)
+        (8, ship_type),
+        # Dimension to Bow (9 bits)
+        (9, to_bow),
+        # Dimension to Stern (9 bits)
+        (9, to_stern),
+        # Dimension to Port (6 bits)
+        (6, to_port),
+        # Dimension to Starboard (6 bits)
+        (6, to_starboard),
+        # Draft (8 bits) - in 0.1 meter steps
+        (8, draft),
+        # Destination (120 bits) - 20 six-bit characters, all spaces
+        (120, _BLANK_DESTINATION),
+        # DTE (1 bit)
+        (1, 0),
+        # Spare (1 bit)
+        (1, 0),
+    )
+    return encode_payload(*pack_fields(fields))
@@ -1,25 +1,32 @@
 import time
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 from socket import socket
 
+import numpy as np
+
 from nmea_simulator.services.message_service import MessageService
-from .ais_vessel import AISVessel
+from .ais_vessel import AISVessel, advance_positions
 
 
 class AISManager:
     """Manages AIS vessel simulation and message generation"""
 
-    def __init__(self, update_interval: float = 10.0):
+    def __init__(self, update_interval: float = 10.0, static_interval: float = 360.0):
         """
         Initialize AIS manager.
 
         Args:
             update_interval: Seconds between AIS updates (default 10.0)
+            static_interval: Seconds between static data reports of a vessel
+                (default 360.0, every 6 minutes as in real AIS)
         """
         self.vessels: List[AISVessel] = []
         self.update_interval = update_interval
+        self.static_interval = static_interval
         self.last_update = 0
+        # Time each vessel last sent its static data, by MMSI
+        self._last_static_update: Dict[int, float] = {}
 
     def add_vessel(self, vessel: AISVessel):
         """Add a vessel to the AIS simulation"""
@@ -34,6 +41,7 @@ class AISManager:
     def remove_vessel(self, mmsi: int):
         """Remove a vessel by MMSI"""
         self.vessels = [v for v in self.vessels if v.mmsi != mmsi]
+        self._last_static_update.pop(mmsi, None)
 
     def get_vessel(self, mmsi: int) -> Optional[AISVessel]:
         """Get vessel by MMSI"""
@@ -67,17 +75,61 @@ class AISManager:
         # Calculate actual time elapsed since last update
         actual_delta_time = current_time - self.last_update
 
+        # Update all vessel positions at once using actual elapsed time
+        self._update_positions(actual_delta_time)
+
+        # All reports of this update share one UTC second
+        timestamp = int(time.time()) % 60
+
         # Update each vessel
         for vessel in self.vessels:
-            # Update vessel position using actual elapsed time
-            vessel.update_position(actual_delta_time)
-
             # Update vessel status
             vessel.update_navigation_status()
 
-            # Generate and send all AIS messages
-            for message in vessel.generate_messages():
-                message_service._send_data(message, f"AIS NMEA: {message.strip()}")
+            # Generate and send AIS messages, terminated so they can share a
+            # batch with other sentences. Static data changes rarely and is
+            # only reported every static_interval.
+            messages = [vessel.generate_position_report(timestamp)]
+            last_static = self._last_static_update.get(vessel.mmsi)
+            if (
+                last_static is None
+                or current_time - last_static >= self.static_interval
+            ):
+                messages.append(vessel.generate_static_data())
+                self._last_static_update[vessel.mmsi] = current_time
+
+            # The sentence is only rendered into the debug log when enabled
+            for message in messages:
+                message_service._send_data(message + "\r\n")
 
         self.last_update = current_time
         return True
+
+    def _update_positions(self, delta_time: float):
+        """
+        Move every vessel with a known position along its course and speed.
+
+        Args:
+            delta_time: Time elapsed since last update in seconds
+        """
+        if delta_time <= 0 or delta_time > 60:  # Cap at 60 seconds max
+            return
+
+        vessels = [vessel for vessel in self.vessels if vessel.position]
+        if not vessels:
+            return
+
+        # Gather the fleet into parallel arrays so the dead reckoning runs as
+        # a handful of vectorized operations instead of per-vessel math calls
+        count = len(vessels)
+        lats, lons = advance_positions(
+            np.fromiter((v.position["lat"] for v in vessels), float, count),
+            np.fromiter((v.position["lon"] for v in vessels), float, count),
+            np.fromiter((v.course for v in vessels), float, count),
+            np.fromiter((v.speed for v in vessels), float, count),
+            delta_time,
+        )
+
+        for vessel, lat, lon in zip(vessels, lats.tolist(), lons.tolist()):
+            vessel.position["lat"] = lat
+            vessel.position["lon"] = lon
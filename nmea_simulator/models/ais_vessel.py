@@ -1,9 +1,113 @@
 import math
 import logging
-import bitstring
-from datetime import datetime, UTC
-from typing import List, Dict, Union
+import time
+from typing import List, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from ..utils.checksum_utils import xor_checksum
 from ..utils.coordinate_utils import parse_coordinate
+from ..utils.navigation_utils import DEGREES_PER_METER, KNOTS_TO_MS
+from .ais_codec import encode_position_report, encode_static_data
+
+# Fixed parts of a single fragment AIVDM sentence on channel A:
+# !AIVDM,1,1,,A,<payload>,0*hh
+_AIVDM_PREFIX = "!AIVDM,1,1,,A,"
+_AIVDM_SUFFIX = ",0"
+# XOR of the fixed characters covered by the checksum (everything after '!')
+_AIVDM_FIXED_XOR = xor_checksum((_AIVDM_PREFIX[1:] + _AIVDM_SUFFIX).encode())
+
+
+def advance_position(
+    lat: float, lon: float, course: float, speed: float, delta_time: float
+) -> Tuple[float, float]:
+    """
+    Dead reckon a single vessel.
+
+    Scalar counterpart of advance_positions, for updating one vessel without
+    the array setup.
+
+    Args:
+        lat: Latitude in decimal degrees
+        lon: Longitude in decimal degrees
+        course: Course over ground in degrees
+        speed: Speed over ground in knots
+        delta_time: Time elapsed since last update in seconds
+
+    Returns:
+        Tuple[float, float]: New (latitude, longitude), normalized
+    """
+    # Distance covered in meters
+    distance = speed * (KNOTS_TO_MS * delta_time)
+
+    # Calculate movement in meters
+    heading_rad = math.radians(course)
+    dx = distance * math.sin(heading_rad)
+    dy = distance * math.cos(heading_rad)
+
+    # Convert to coordinate changes
+    dlat = dy * DEGREES_PER_METER
+    dlon = dx * DEGREES_PER_METER / math.cos(math.radians(lat))
+
+    # Update and normalize coordinates
+    return max(-90, min(90, lat + dlat)), math.remainder(lon + dlon, 360.0)
+
+
+def advance_positions(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    courses: np.ndarray,
+    speeds: np.ndarray,
+    delta_time: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dead reckon a whole fleet of vessels at once.
+
+    Vectorized equivalent of AISVessel.update_position over parallel arrays.
+
+    Args:
+        lats: Latitudes in decimal degrees
+        lons: Longitudes in decimal degrees
+        courses: Courses over ground in degrees
+        speeds: Speeds over ground in knots
+        delta_time: Time elapsed since last update in seconds
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: New (latitudes, longitudes), normalized
+    """
+    # Distance covered in meters
+    distance = speeds * (KNOTS_TO_MS * delta_time)
+
+    # Calculate movement in meters
+    heading_rad = np.radians(courses)
+    dx = distance * np.sin(heading_rad)
+    dy = distance * np.cos(heading_rad)
+
+    # Convert to coordinate changes
+    dlat = dy * DEGREES_PER_METER
+    dlon = dx * DEGREES_PER_METER / np.cos(np.radians(lats))
+
+    # Update and normalize coordinates
+    new_lats = np.clip(lats + dlat, -90, 90)
+    new_lons = ((lons + dlon + 180) % 360) - 180
+    return new_lats, new_lons
+
+
+class _StaticField:
+    """Vessel attribute that invalidates the cached static data payload when set"""
+
+    def __set_name__(self, owner, name):
+        self.attr = "_" + name
+
+    def __get__(self, vessel, owner=None):
+        if vessel is None:
+            return self
+        return vessel.__dict__[self.attr]
+
+    def __set__(self, vessel, value):
+        vessel.__dict__[self.attr] = value
+        vessel._static_payload_cache = None
+        vessel._static_sentence_cache = None
 
 
 class AISVessel:
@@ -34,6 +138,15 @@ class AISVessel:
         "DREDGER": 33,  # Dredger
     }
 
+    # Fields encoded in the static data message (Type 5)
+    mmsi = _StaticField()
+    vessel_name = _StaticField()
+    ship_type = _StaticField()
+    call_sign = _StaticField()
+    length = _StaticField()
+    beam = _StaticField()
+    draft = _StaticField()
+
     def __init__(
         self,
         mmsi: int,
@@ -66,6 +179,10 @@ class AISVessel:
             navigation_status (int, optional): AIS navigation status code
             rot (float, optional): Rate of turn in degrees per minute
         """
+        # Type 5 payload and sentence, rebuilt only when one of their fields changes
+        self._static_payload_cache: Optional[str] = None
+        self._static_sentence_cache: Optional[str] = None
+
         # Required parameters
         if not isinstance(mmsi, int) or len(str(mmsi)) != 9:
             raise ValueError("MMSI must be a 9-digit integer")
@@ -106,6 +223,10 @@ class AISVessel:
             except (KeyError, ValueError) as e:
                 raise ValueError(f"Invalid position format: {position}") from e
 
+        # Build the static data sentence up front so that the first update of
+        # the simulation only has to read it back
+        self.generate_static_data()
+
     def update_position(self, delta_time: float):
         """
         Update vessel position based on course and speed
@@ -118,42 +239,37 @@ class AISVessel:
         ):  # Cap at 60 seconds max
             return
 
-        # Convert speed to meters per second
-        speed_ms = self.speed * 0.514444  # 1 knot = 0.514444 m/s
-
-        # Calculate movement in meters
-        heading_rad = math.radians(self.course)
-        dx = speed_ms * math.sin(heading_rad) * delta_time
-        dy = speed_ms * math.cos(heading_rad) * delta_time
-
-        # Convert to coordinate changes
-        R = 6371000.0  # Earth radius in meters
-        lat_rad = math.radians(self.position["lat"])
-
-        # Calculate position changes in degrees
-        dlat = (dy / R) * (180.0 / math.pi)  # More direct conversion to degrees
-        # Adjust longitude change based on latitude to account for meridian convergence
-        dlon = (dx / (R * math.cos(lat_rad))) * (180.0 / math.pi)
-
-        # Log before updating
-        logging.debug(
-            f"Updating position for vessel {self.mmsi}:"
-            f"\n  Speed: {self.speed:.1f} knots"
-            f"\n  Course: {self.course:.1f}°"
-            f"\n  Delta time: {delta_time:.3f} seconds"
-            f"\n  Movement: dx={dx:.2f}m, dy={dy:.2f}m"
-            f"\n  Changes: dlat={dlat:.6f}°, dlon={dlon:.6f}°"
-            f"\n  Current: {self.position['lat']:.6f}°N, {self.position['lon']:.6f}°W"
-            f"\n  New pos: {self.position['lat'] + dlat:.6f}°N, {self.position['lon'] + dlon:.6f}°W"
+        lat = self.position["lat"]
+        lon = self.position["lon"]
+        new_lat, new_lon = advance_position(
+            lat, lon, self.course, self.speed, delta_time
         )
 
-        # Update position
-        self.position["lat"] += dlat
-        self.position["lon"] += dlon
+        # Log before updating, only formatted when debug logging is enabled
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "Updating position for vessel %d:"
+                "\n  Speed: %.1f knots"
+                "\n  Course: %.1f°"
+                "\n  Delta time: %.3f seconds"
+                "\n  Changes: dlat=%.6f°, dlon=%.6f°"
+                "\n  Current: %.6f°N, %.6f°W"
+                "\n  New pos: %.6f°N, %.6f°W",
+                self.mmsi,
+                self.speed,
+                self.course,
+                delta_time,
+                new_lat - lat,
+                new_lon - lon,
+                lat,
+                lon,
+                new_lat,
+                new_lon,
+            )
 
-        # Normalize coordinates
-        self.position["lat"] = max(-90, min(90, self.position["lat"]))
-        self.position["lon"] = ((self.position["lon"] + 180) % 360) - 180
+        # Update position
+        self.position["lat"] = new_lat
+        self.position["lon"] = new_lon
 
     def update_navigation_status(self):
         """Update navigation status based on vessel state"""
@@ -214,39 +330,21 @@ class AISVessel:
 
         return ais_rot
 
-    def encode_position_report(self):
+    def encode_position_report(self, timestamp: Optional[int] = None):
         """
         Encode a Position Report (Message Type 1) in AIVDM format
         Returns the payload part of the AIVDM sentence
-        """
-        # Create a BitArray to hold the message
-        bits = bitstring.BitArray()
-
-        # Message Type (6 bits) - Position Report is type 1
-        bits.append(bitstring.pack("uint:6", 1))
-
-        # Repeat Indicator (2 bits)
-        bits.append(bitstring.pack("uint:2", 0))
-
-        # MMSI (30 bits)
-        bits.append(bitstring.pack("uint:30", self.mmsi))
-
-        # Navigation Status (4 bits)
-        bits.append(bitstring.pack("uint:4", self.navigation_status))
 
-        # Rate of Turn (8 bits)
-        bits.append(bitstring.pack("int:8", self.encode_rate_of_turn()))
-
-        # Speed Over Ground (10 bits) - in 0.1 knot steps
+        Args:
+            timestamp (int, optional): UTC second of the report, read from the
+                clock when not given. A fleet can share one clock read.
+        """
         speed_int = int(self.speed * 10)
-        bits.append(bitstring.pack("uint:10", min(speed_int, 1023)))
-
-        # Position Accuracy (1 bit) - 0 = low, 1 = high
-        bits.append(bitstring.pack("uint:1", 0))
 
         # Convert coordinates to AIS format (in 1/10000 minute)
-        # Ensure longitude is within valid range (-180 to 180)
-        lon = ((self.position["lon"] + 180) % 360) - 180
+        # Ensure longitude is within valid range (-180 to 180), the IEEE
+        # remainder wraps exactly and is cheaper than shifting for a modulo
+        lon = math.remainder(self.position["lon"], 360.0)
         # Convert to AIS format
         lon_ais = int(lon * 600000)
         # Clamp to valid range for 28-bit signed integer
@@ -258,149 +356,66 @@ class AISVessel:
         # Clamp to valid range for 27-bit signed integer
         lat_ais = max(-67108864, min(67108863, lat_ais))
 
-        # Longitude (28 bits) - in 1/10000 minute
-        bits.append(bitstring.pack("int:28", lon_ais))
-
-        # Latitude (27 bits) - in 1/10000 minute
-        bits.append(bitstring.pack("int:27", lat_ais))
-
-        # Course Over Ground (12 bits) - in 0.1 degree steps
-        cog = int(self.course * 10)
-        bits.append(bitstring.pack("uint:12", cog))
-
-        # True Heading (9 bits) - use COG if not available
-        bits.append(bitstring.pack("uint:9", int(self.course)))
-
-        # Time Stamp (6 bits) - seconds of UTC timestamp
-        timestamp = datetime.now(UTC).second
-        bits.append(bitstring.pack("uint:6", timestamp))
-
-        # Reserved (4 bits)
-        bits.append(bitstring.pack("uint:4", 0))
-
-        # Return the binary data encoded in 6-bit ASCII format
-        return self._encode_payload(bits)
+        return encode_position_report(
+            self.mmsi,
+            self.navigation_status,
+            self.encode_rate_of_turn(),
+            min(speed_int, 1023),
+            lon_ais,
+            lat_ais,
+            int(self.course * 10),
+            # True Heading - use COG if not available
+            int(self.course),
+            int(time.time()) % 60 if timestamp is None else timestamp,
+        )
 
     def encode_static_data(self):
         """
         Encode Static and Voyage Related Data (Message Type 5)
         Uses 6-bit ASCII encoding as per ITU-R M.1371
         """
-        bits = bitstring.BitArray()
-
-        # Message Type (6 bits) - Type 5
-        bits.append(bitstring.pack("uint:6", 5))
-
-        # Repeat Indicator (2 bits)
-        bits.append(bitstring.pack("uint:2", 0))
-
-        # MMSI (30 bits)
-        bits.append(bitstring.pack("uint:30", self.mmsi))
-
-        # AIS Version (2 bits)
-        bits.append(bitstring.pack("uint:2", 0))
-
-        # IMO Number (30 bits) - Using 0 for this example
-        bits.append(bitstring.pack("uint:30", 0))
-
-        # Call Sign (42 bits) - 7 six-bit characters
-        call_sign_padded = self.call_sign.ljust(7)
-        for char in call_sign_padded:
-            # Convert to 6-bit ASCII as per ITU-R M.1371
-            if ord(char) >= 64:  # '@' and above
-                sixbit = ord(char) - 64
-            elif ord(char) >= 32:  # Space and above
-                sixbit = ord(char)
-            else:  # Below space
-                sixbit = 32  # Default to space
-            bits.append(bitstring.pack("uint:6", sixbit))
-
-        # Vessel Name (120 bits) - 20 six-bit characters
-        name_padded = self.vessel_name.ljust(20)
-        for char in name_padded:
-            # Convert to 6-bit ASCII
-            if ord(char) >= 64:  # '@' and above
-                sixbit = ord(char) - 64
-            elif ord(char) >= 32:  # Space and above
-                sixbit = ord(char)
-            else:  # Below space
-                sixbit = 32  # Default to space
-            bits.append(bitstring.pack("uint:6", sixbit))
-
-        # Ship Type (8 bits)
-        bits.append(bitstring.pack("uint:8", self.ship_type))
-
-        # Dimension to Bow (9 bits)
-        bits.append(bitstring.pack("uint:9", int(self.length / 2)))
-
-        # Dimension to Stern (9 bits)
-        bits.append(bitstring.pack("uint:9", int(self.length / 2)))
-
-        # Dimension to Port (6 bits)
-        bits.append(bitstring.pack("uint:6", int(self.beam / 2)))
-
-        # Dimension to Starboard (6 bits)
-        bits.append(bitstring.pack("uint:6", int(self.beam / 2)))
-
-        # Draft (8 bits) - in 0.1 meter steps
-        draft_dm = int(self.draft * 10)
-        bits.append(bitstring.pack("uint:8", draft_dm))
-
-        # Destination (120 bits) - 20 six-bit characters
-        destination = "".ljust(20)
-        for char in destination:
-            bits.append(bitstring.pack("uint:6", 32))  # Space
-
-        # DTE (1 bit)
-        bits.append(bitstring.pack("uint:1", 0))
-
-        # Spare (1 bit)
-        bits.append(bitstring.pack("uint:1", 0))
-
-        return self._encode_payload(bits)
+        if self._static_payload_cache is not None:
+            return self._static_payload_cache
+
+        self._static_payload_cache = encode_static_data(
+            self.mmsi,
+            self.call_sign,
+            self.vessel_name,
+            self.ship_type,
+            int(self.length / 2),
+            int(self.length / 2),
+            int(self.beam / 2),
+            int(self.beam / 2),
+            int(self.draft * 10),
+        )
+        return self._static_payload_cache
 
-    def _encode_payload(self, bits):
+    def generate_position_report(self, timestamp: Optional[int] = None):
         """
-        Convert binary message to 6-bit ASCII payload
+        Generate complete NMEA AIVDM sentence
         """
-        # Pad to multiple of 6 bits
-        while len(bits) % 6:
-            bits.append("0b0")
-
-        # Convert 6-bit groups to ASCII characters
-        payload = ""
-        for i in range(0, len(bits), 6):
-            sixbits = bits[i : i + 6].uint
-            if sixbits < 40:
-                payload += chr(sixbits + 48)
-            else:
-                payload += chr(sixbits + 56)
-
-        return payload
+        return self._build_sentence(self.encode_position_report(timestamp))
 
-    def generate_position_report(self):
+    def generate_static_data(self):
         """
         Generate complete NMEA AIVDM sentence
         """
-        payload = self.encode_position_report()
-        # AIVDM,1,1,,A,payload,0
-        checksum = self._calculate_checksum(f"AIVDM,1,1,,A,{payload},0")
-        return f"!AIVDM,1,1,,A,{payload},0*{checksum}"
+        if self._static_sentence_cache is not None:
+            return self._static_sentence_cache
 
-    def generate_static_data(self):
+        self._static_sentence_cache = self._build_sentence(self.encode_static_data())
+        return self._static_sentence_cache
+
+    def _build_sentence(self, payload):
         """
-        Generate complete NMEA AIVDM sentence
+        Wrap a payload in a single fragment AIVDM sentence
         """
-        payload = self.encode_static_data()
-        # AIVDM,1,1,,A,payload,0
-        checksum = self._calculate_checksum(f"AIVDM,1,1,,A,{payload},0")
-        return f"!AIVDM,1,1,,A,{payload},0*{checksum}"
+        # Only the payload varies, the fixed parts are folded into the seed
+        checksum = self._calculate_checksum(payload, _AIVDM_FIXED_XOR)
+        return f"{_AIVDM_PREFIX}{payload}{_AIVDM_SUFFIX}*{checksum}"
 
-    def _calculate_checksum(self, data):
+    def _calculate_checksum(self, data, checksum=0):
         """
-        Calculate the NMEA checksum
+        Calculate the NMEA checksum, continuing from an initial checksum value
         """
-        checksum = 0
-        for char in data:
-            checksum ^= ord(char)
-        return format(checksum, "02X")
+        return "%02X" % xor_checksum(data.encode("ascii"), checksum)
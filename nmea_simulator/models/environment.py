@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Current:
     """Water current information"""
 
@@ -11,7 +11,7 @@ class Current:
     direction: float  # degrees true (direction flowing TOWARDS)
 
 
-@dataclass
+@dataclass(slots=True)
 class Wind:
     """Wind information"""
 
@@ -19,7 +19,7 @@ class Wind:
     direction: float  # degrees true (direction coming FROM)
 
 
-@dataclass
+@dataclass(slots=True)
 class Environment:
     """Environmental conditions container"""
 
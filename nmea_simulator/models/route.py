@@ -1,10 +1,19 @@
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
-from nmea_simulator.utils.coordinate_utils import calculate_bearing, calculate_distance
+import numpy as np
 
+from nmea_simulator.utils.coordinate_utils import (
+    LegGeometry,
+    calculate_bearings,
+    calculate_distance_and_bearing,
+    calculate_distances,
+    calculate_leg_geometry,
+    calculate_leg_navigation,
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class Waypoint:
     """Single waypoint in a route"""
 
@@ -13,7 +22,7 @@ class Waypoint:
     name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteSegment:
     """Represents a segment between two waypoints"""
 
@@ -23,7 +32,7 @@ class RouteSegment:
     bearing: float  # Initial bearing in degrees true
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Current position"""
 
@@ -40,6 +49,21 @@ class RouteManager:
             waypoint_threshold: Distance in nautical miles to consider waypoint reached
         """
         self.waypoints: List[Waypoint] = []
+        # Waypoint coordinates as an (N, 2) array of lat/lon for vectorized
+        # route computations
+        self.waypoint_array = np.empty((0, 2))
+        # Segment for each leg, leg i runs from waypoint i to waypoint i + 1
+        self._segments: List[RouteSegment] = []
+        # Position independent cross track error terms of each leg
+        self._leg_geometries: List[LegGeometry] = []
+        # Last range, bearing and cross track error to the active waypoint,
+        # keyed by the vessel position and waypoint index they were computed for
+        self._navigation_key: Optional[Tuple[float, float, int]] = None
+        self._navigation: Tuple[float, float, Optional[Tuple[float, str]]] = (
+            0.0,
+            0.0,
+            None,
+        )
         self.current_index: int = 0
         self.waypoint_threshold = waypoint_threshold
         self.reverse_direction = False
@@ -47,6 +71,29 @@ class RouteManager:
     def set_waypoints(self, waypoints: List[Dict[str, float]]):
         """Set route waypoints from list of lat/lon dictionaries"""
         self.waypoints = [Waypoint(lat=wp["lat"], lon=wp["lon"]) for wp in waypoints]
+        self.waypoint_array = np.array(
+            [(wp.lat, wp.lon) for wp in self.waypoints], dtype=np.float64
+        ).reshape(-1, 2)
+
+        # Legs are fixed for the route, compute all their lengths and bearings
+        # in one go
+        lats, lons = self.waypoint_array[:, 0], self.waypoint_array[:, 1]
+        legs = (lats[:-1], lons[:-1], lats[1:], lons[1:])
+        self._segments = [
+            RouteSegment(start, end, distance, bearing)
+            for start, end, distance, bearing in zip(
+                self.waypoints,
+                self.waypoints[1:],
+                calculate_distances(*legs).tolist(),
+                calculate_bearings(*legs).tolist(),
+            )
+        ]
+        self._leg_geometries = [
+            calculate_leg_geometry(start.lat, start.lon, end.lat, end.lon)
+            for start, end in zip(self.waypoints, self.waypoints[1:])
+        ]
+        self._navigation_key = None
+
         self.current_index = 1 if len(self.waypoints) > 1 else 0
         self.reverse_direction = False
 
@@ -55,14 +102,70 @@ class RouteManager:
         if self.current_index == 0 or self.current_index >= len(self.waypoints):
             return None
 
-        start = self.waypoints[self.current_index - 1]
-        end = self.waypoints[self.current_index]
+        return self._segments[self.current_index - 1]
+
+    def get_cross_track_error(
+        self, current_position: Position
+    ) -> Optional[Tuple[float, str]]:
+        """
+        Calculate cross track error from the current route segment.
+
+        Args:
+            current_position: Current vessel position
+
+        Returns:
+            Optional[Tuple[float, str]]: (XTE magnitude in nautical miles,
+                direction to steer 'L' or 'R'), None if no segment is active
+        """
+        if self.current_index == 0 or self.current_index >= len(self.waypoints):
+            return None
+
+        return self._navigate(current_position)[2]
+
+    def get_range_and_bearing(self, current_position: Position) -> Tuple[float, float]:
+        """
+        Calculate distance and bearing from current position to next waypoint.
+
+        Args:
+            current_position: Current vessel position
 
-        distance = calculate_distance(start.lat, start.lon, end.lat, end.lon)
+        Returns:
+            Tuple[float, float]: (distance in nautical miles, bearing in degrees true)
+        """
+        distance, bearing, _ = self._navigate(current_position)
+        return distance, bearing
 
-        bearing = calculate_bearing(start.lat, start.lon, end.lat, end.lon)
+    def _navigate(
+        self, current_position: Position
+    ) -> Tuple[float, float, Optional[Tuple[float, str]]]:
+        """
+        Range, bearing and cross track error to the active waypoint.
 
-        return RouteSegment(start, end, distance, bearing)
+        Steering, logging and the route sentences all ask for these at the same
+        position, so they are computed together in one pass over the shared
+        trigonometry and reused until the position or waypoint changes.
+        """
+        key = (current_position.lat, current_position.lon, self.current_index)
+        if key != self._navigation_key:
+            if 0 < self.current_index < len(self.waypoints):
+                distance, bearing, xte, direction = calculate_leg_navigation(
+                    current_position.lat,
+                    current_position.lon,
+                    self._leg_geometries[self.current_index - 1],
+                )
+                self._navigation = (distance, bearing, (xte, direction))
+            else:
+                # No active leg, only range and bearing to the waypoint
+                next_waypoint = self.waypoints[self.current_index]
+                distance, bearing = calculate_distance_and_bearing(
+                    current_position.lat,
+                    current_position.lon,
+                    next_waypoint.lat,
+                    next_waypoint.lon,
+                )
+                self._navigation = (distance, bearing, None)
+            self._navigation_key = key
+        return self._navigation
 
     def get_distance_to_next_waypoint(self, current_position: Position) -> float:
         """
@@ -77,13 +180,7 @@ class RouteManager:
         if self.current_index >= len(self.waypoints):
             return 0.0
 
-        next_waypoint = self.waypoints[self.current_index]
-        return calculate_distance(
-            current_position.lat,
-            current_position.lon,
-            next_waypoint.lat,
-            next_waypoint.lon,
-        )
+        return self.get_range_and_bearing(current_position)[0]
 
     def update_course_to_waypoint(
         self, current_position: Position
@@ -102,13 +199,19 @@ class RouteManager:
         if not self.waypoints:
             return False, None
 
-        next_waypoint = self.waypoints[self.current_index]
-
-        # Calculate distance and bearing to next waypoint
-        distance = self.get_distance_to_next_waypoint(current_position)
-
-        # If we're close enough to waypoint, move to next one
-        if distance < self.waypoint_threshold:
+        # Skip past every waypoint already within reach. Each waypoint is
+        # visited at most twice per lap, which also bounds the loop when all
+        # of them are closer than the threshold.
+        for _ in range(2 * len(self.waypoints)):
+            # Calculate distance and bearing to next waypoint
+            distance, new_course = self.get_range_and_bearing(current_position)
+            if distance >= self.waypoint_threshold:
+                break
+            if len(self.waypoints) == 1:
+                # A lone waypoint has nowhere to turn around to, hold it
+                break
+
+            # Close enough to waypoint, move to next one
             if self.reverse_direction:
                 self.current_index -= 1
                 if self.current_index < 0:
@@ -119,17 +222,9 @@ class RouteManager:
                 if self.current_index >= len(self.waypoints):
                     self.current_index = len(self.waypoints) - 2
                     self.reverse_direction = True
-
-            # Recursively update for new waypoint
-            return self.update_course_to_waypoint(current_position)
-
-        # Calculate new course to waypoint
-        new_course = calculate_bearing(
-            current_position.lat,
-            current_position.lon,
-            next_waypoint.lat,
-            next_waypoint.lon,
-        )
+        else:
+            # Every waypoint is within reach, steer for the current one
+            new_course = self.get_range_and_bearing(current_position)[1]
 
         return True, new_course
 
@@ -144,14 +239,11 @@ class RouteManager:
         Returns:
             bool: True if navigation should continue, False if route complete
         """
-        segment = self.get_current_segment()
-        if not segment:
+        if not self.get_current_segment():
             return False
 
-        # Calculate distance to next waypoint
-        distance = calculate_distance(
-            current_lat, current_lon, segment.end.lat, segment.end.lon
-        )
+        # Calculate distance to next waypoint, shared with the route sentences
+        distance = self.get_range_and_bearing(Position(current_lat, current_lon))[0]
 
         # Check if waypoint reached
         if distance < self.waypoint_threshold:
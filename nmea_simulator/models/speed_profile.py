@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from datetime import timedelta
 from typing import List, Optional, Tuple, Union
 import logging
+import math
 import time
 
 
@@ -28,8 +29,12 @@ class SpeedManager:
     def __init__(self):
         """Initialize speed manager"""
         self._speed_profile: List[SpeedSegment] = []
+        # Duration of each segment in seconds, infinite for open ended ones
+        self._segment_durations: List[float] = []
         self._current_segment = 0
         self._segment_start_time: Optional[float] = None
+        # Time the current segment ends, infinite once the profile is done
+        self._segment_deadline = math.inf
         self._current_speed = 0.0
 
     def set_speed_profile(self, profile: List[Tuple[Union[timedelta, None], float]]):
@@ -43,8 +48,13 @@ class SpeedManager:
         """
         # Convert profile to SpeedSegments
         self._speed_profile = [SpeedSegment(duration=d, speed=s) for d, s in profile]
+        self._segment_durations = [
+            d.total_seconds() if d is not None else math.inf for d, _ in profile
+        ]
         self._current_segment = 0
         self._segment_start_time = None
+        # Already passed so that the next update starts the first segment
+        self._segment_deadline = -math.inf if self._speed_profile else math.inf
 
         # Set initial speed
         if self._speed_profile:
@@ -62,12 +72,17 @@ class SpeedManager:
         Returns:
             float: Current speed in knots
         """
-        if not self._speed_profile or self._current_segment >= len(self._speed_profile):
+        # Nothing to do until the current segment ends, which never happens
+        # without a profile, after its last segment or in an open ended one
+        if current_time < self._segment_deadline:
             return self._current_speed
 
         # Initialize segment start time if needed
         if self._segment_start_time is None:
             self._segment_start_time = current_time
+            self._segment_deadline = (
+                current_time + self._segment_durations[self._current_segment]
+            )
             self._current_speed = self._speed_profile[self._current_segment].speed
             logging.info(
                 f"Starting speed segment {self._current_segment}: "
@@ -75,24 +90,21 @@ class SpeedManager:
             )
             return self._current_speed
 
-        current_segment = self._speed_profile[self._current_segment]
-        elapsed_time = current_time - self._segment_start_time
-
-        # Check if we need to move to the next segment
-        if current_segment.duration is not None:
-            if elapsed_time >= current_segment.duration.total_seconds():
-                self._current_segment += 1
-                self._segment_start_time = current_time
-
-                # Update speed if there's a next segment
-                if self._current_segment < len(self._speed_profile):
-                    self._current_speed = self._speed_profile[
-                        self._current_segment
-                    ].speed
-                    logging.info(
-                        f"Changing to speed segment {self._current_segment}: "
-                        f"{self._current_speed} knots"
-                    )
+        # Move to the next segment
+        self._current_segment += 1
+        self._segment_start_time = current_time
+        self._segment_deadline = math.inf
+
+        # Update speed if there's a next segment
+        if self._current_segment < len(self._speed_profile):
+            self._segment_deadline = (
+                current_time + self._segment_durations[self._current_segment]
+            )
+            self._current_speed = self._speed_profile[self._current_segment].speed
+            logging.info(
+                f"Changing to speed segment {self._current_segment}: "
+                f"{self._current_speed} knots"
+            )
 
         return self._current_speed
 
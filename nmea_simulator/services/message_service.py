@@ -1,22 +1,36 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import UTC, datetime
 from enum import Enum
-from socket import socket, AF_INET, SOCK_DGRAM, SOCK_STREAM, SOL_SOCKET, SO_REUSEADDR
+from socket import (
+    socket,
+    gethostbyname,
+    AF_INET,
+    SOCK_DGRAM,
+    SOCK_STREAM,
+    SOL_SOCKET,
+    SO_REUSEADDR,
+    SO_SNDBUF,
+)
 import logging
-import re
 import threading
 import time
-from typing import Dict, Optional, Union, List
+from typing import Dict, Optional, Tuple, Union, List
 
 from nmea_simulator.models.route import Position, RouteManager
 from .nmea2000 import NMEA2000Formatter, NMEA2000Message, MessageVerifier, PGN
-from nmea_simulator.utils.coordinate_utils import (
-    calculate_bearing,
-    calculate_cross_track_error,
-    calculate_distance,
-)
-from nmea_simulator.utils.navigation_utils import calculate_vmg
+from nmea_simulator.utils.checksum_utils import sentence_checksum, xor_checksum
+from nmea_simulator.utils.navigation_utils import KNOTS_TO_MS, calculate_vmg
+
+# Unit conversion factors
+METERS_TO_FEET = 3.28084
+METERS_TO_FATHOMS = 0.546807
+KNOTS_TO_KMH = 1.852  # 1 knot = 1.852 km/h
+
+# Requested UDP socket send buffer size in bytes
+UDP_SEND_BUFFER_SIZE = 1 << 20
+# Dropped UDP datagrams are reported once per this many drops
+UDP_DROP_LOG_INTERVAL = 100
 
 
 @dataclass
@@ -42,32 +56,63 @@ class TransportProtocol(Enum):
 class NMEA0183Formatter:
     """Formats messages according to NMEA 0183 standard"""
 
-    def format_message(self, message: str) -> List[str]:
-        """Format NMEA 0183 message with checksum"""
-        if not message.startswith("$"):
-            message = "$" + message
+    def __init__(self):
+        # Reused for every sentence to avoid rebuilding strings per message
+        self._buffer = bytearray()
 
-        checksum = self.calculate_checksum(message)
-        formatted = f"{message}*{checksum}\r\n"
-        return [formatted]
+    def format_message(self, message: Union[str, bytes]) -> List[bytearray]:
+        """
+        Format NMEA 0183 message with checksum.
 
-    def calculate_checksum(self, sentence: str) -> str:
-        """Calculate NMEA 0183 checksum"""
-        start = 1
-        end = sentence.find("*")
-        if end == -1:
-            end = len(sentence)
+        The sentence is written into a buffer owned by the formatter, so the
+        returned data is only valid until the next call to format_message.
+        """
+        data = message.encode("ascii") if isinstance(message, str) else message
+        if data.startswith(b"$"):
+            data = data[1:]
 
-        checksum = 0
-        for char in sentence[start:end]:
-            checksum ^= ord(char)
+        buf = self._buffer
+        buf.clear()
+        buf.append(0x24)  # '$'
+        buf += data
+        buf += b"*%02X\r\n" % xor_checksum(data)
+        return [buf]
 
-        return f"{checksum:02X}"
+    def calculate_checksum(self, sentence: str) -> str:
+        """Calculate NMEA 0183 checksum"""
+        return sentence_checksum(sentence)
 
 
 class MessageService:
     """Handles NMEA message formatting and sending"""
 
+    # NMEA 0183 sentence templates, the first field is always the talker ID.
+    # %-formatting a constant template is cheaper than rebuilding an f-string
+    # out of its literal pieces on every call. Sentences are formatted
+    # straight to bytes, which saves encoding them again before sending, so
+    # text fields are passed in as bytes too.
+    # MWV has one template per wind reference, T (True) and R (Relative)
+    _MWV_TRUE_FMT = b"%sMWV,%.1f,T,%.1f,N,A"
+    _MWV_APPARENT_FMT = b"%sMWV,%.1f,R,%.1f,N,A"
+    _GGA_FMT = b"%sGGA,%s,%s,%s,%d,%02d,%.1f,%.1f,M,%.1f,M,%s,%s"
+    _XTE_FMT = b"%sXTE,A,A,%.3f,%s,N"
+    _DBT_FMT = b"%sDBT,%.1f,f,%.1f,M,%.1f,F"
+    _RSA_DUAL_FMT = b"%sRSA,%.1f,A,%.1f,A"
+    _RSA_SINGLE_FMT = b"%sRSA,%.1f,A,,"
+    _VHW_FMT = b"%sVHW,%.1f,T,%.1f,M,%.1f,N,%.1f,K"
+    _RMB_FMT = b"%sRMB,A,%.1f,%s,%s,%s,%s,%s,%.1f,%.1f,%.1f,%s,A"
+    # RMB with no active waypoint: status only, every navigation field empty,
+    # arrival not valid and data not valid
+    _RMB_EMPTY_FMT = b"%sRMB,A,,,,,,,,,,,,V,N"
+    _MWD_FMT = b"%sMWD,%.1f,T,%.1f,M,%.1f,N,%.1f,M"
+    _RMC_FMT = b"%sRMC,%s,A,%s,%s,%.1f,%.1f,%s,%.1f,%s,,A"
+    _HDT_FMT = b"%sHDT,%.1f,T"
+    _HDM_FMT = b"%sHDM,%.1f,M"
+    _HDG_FMT = b"%sHDG,%.1f,0.0,E,%.1f,W"
+    # Latitude ddmm.mmm,N/S and longitude dddmm.mmm,E/W position fields
+    _LAT_FMT = "%02d%06.3f,%s"
+    _LON_FMT = "%03d%06.3f,%s"
+
     def __init__(
         self,
         host: str = None,
@@ -77,6 +122,7 @@ class MessageService:
         exclude_sentences: List[str] = None,
         network_protocol: TransportProtocol = TransportProtocol.UDP,
         talker_id: str = "GP",
+        max_batch_size: int = 1200,
     ):
         """
         Initialize the NMEA message service.
@@ -121,6 +167,10 @@ class MessageService:
                       - VW: Velocity Sensor, Water referenced
                       - HC: Heading and Course Equipment
 
+            max_batch_size: Maximum number of bytes sent in a single write while
+                           batching. Defaults to 1200, which keeps UDP datagrams
+                           below a typical path MTU.
+
         Creates:
             - UDP socket for sending messages or TCP server for listening
             - Appropriate message formatter based on protocol version
@@ -144,9 +194,27 @@ class MessageService:
             )
         self.talker_id = talker_id.upper()
 
+        # Validate the version before any socket is opened, so a bad value
+        # does not leave a bound port or accept thread behind
+        if not isinstance(nmea_version, NMEAVersion):
+            raise ValueError(f"Unsupported NMEA version: {nmea_version}")
+
         # Create appropriate socket type
         if network_protocol == TransportProtocol.UDP:
             self.sock = socket(AF_INET, SOCK_DGRAM)
+            # Sends never wait for buffer space, see _transmit()
+            self.sock.setblocking(False)
+            # A larger send buffer absorbs a whole tick of datagrams without
+            # hitting the drop path in _transmit
+            self.sock.setsockopt(SOL_SOCKET, SO_SNDBUF, UDP_SEND_BUFFER_SIZE)
+            send_buffer = self.sock.getsockopt(SOL_SOCKET, SO_SNDBUF)
+            if send_buffer < UDP_SEND_BUFFER_SIZE:
+                logging.debug(
+                    "UDP send buffer limited to %d bytes by the OS", send_buffer
+                )
+            # Resolve the destination once so a host name is not looked up
+            # again on every datagram
+            self._address = (gethostbyname(host) if host else host, port)
         else:  # TCP
             self.sock = socket(AF_INET, SOCK_STREAM)
             self.sock.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
@@ -159,16 +227,40 @@ class MessageService:
             self._accept_thread.start()
             logging.info(f"TCP server listening on {host}:{port}")
 
+        # The version is fixed for the lifetime of the service, so pick the
+        # per-message send handler once instead of branching on every message
         if nmea_version == NMEAVersion.NMEA_0183:
             self.formatter = NMEA0183Formatter()
+            self._send_formatted_message = self._send_nmea_0183_message
             logging.info(
                 f"Initialized NMEA message service for {nmea_version.value} over {network_protocol.value}"
             )
         else:
             self.formatter = NMEA2000Formatter(output_format=n2k_format)
+            self._send_formatted_message = self._send_nmea_2000_message
             logging.info(
                 f"Initialized NMEA message service for {nmea_version.value} over {network_protocol.value}. Format: {n2k_format}"
             )
+        # Outgoing data is queued here while a batch is open, see batch()
+        self.max_batch_size = max_batch_size
+        self._tx_buffer = bytearray()
+        self._batch_depth = 0
+        # UDP datagrams dropped because the send buffer was full
+        self.dropped_datagrams = 0
+
+        # UTC time and date fields, reformatted only when the second changes
+        self._utc_second: Optional[int] = None
+        self._utc_fields: Tuple[bytes, bytes] = (b"", b"")
+
+        # Vessel position fields shared by RMC and GGA, reformatted only when
+        # the position changes
+        self._position_key: Optional[Tuple[float, float]] = None
+        self._position_fields: Tuple[bytes, bytes] = (b"", b"")
+
+        # RMB waypoint fields, reformatted only when the active waypoint changes
+        self._rmb_waypoint_key = None
+        self._rmb_waypoint_fields = None
+
         # All possible sentence types
         self.all_sentence_types = [
             "RMC",
@@ -185,15 +277,30 @@ class MessageService:
             "MWD",
         ]
 
-        # Set up sentence exclusion
+        # Set up sentence exclusion, the set is what the send path checks
         self.exclude_sentences = exclude_sentences or []
+        self._excluded_sentences = frozenset(self.exclude_sentences)
+        self._excluded_sentence_bytes = frozenset(
+            sentence.encode() for sentence in self.exclude_sentences
+        )
 
         # Validate excluded sentences
         invalid_sentences = set(self.exclude_sentences) - set(self.all_sentence_types)
         if invalid_sentences:
             raise ValueError(f"Invalid sentence types to exclude: {invalid_sentences}")
 
-    def _should_send_sentence(self, message: str) -> bool:
+    @property
+    def talker_id(self) -> str:
+        """Two-character talker ID used in NMEA 0183 messages"""
+        return self._talker_id
+
+    @talker_id.setter
+    def talker_id(self, talker_id: str):
+        self._talker_id = talker_id
+        # Talker ID for the byte sentence templates
+        self._talker_bytes = talker_id.encode("ascii")
+
+    def _should_send_sentence(self, message: Union[str, bytes]) -> bool:
         """
         Determine if a given sentence should be sent based on enabled sentences.
 
@@ -203,21 +310,25 @@ class MessageService:
         Returns:
             bool: True if the sentence should be sent, False otherwise
         """
-        # Extract the sentence type (without talker ID)
-        match = re.match(r"\$?[A-Z]{2}([A-Z]{3})", message)
-        send = False
-        sentence_type = None
-        if match:
-            sentence_type = match.group(1)
-            send = sentence_type not in self.exclude_sentences
-        return send
-
-    def send_nmea(self, message: Union[str, NMEA2000Message]):
+        # The header is the talker ID and sentence type, five uppercase
+        # letters after an optional '$'
+        header = message[1:6] if message[:1] in ("$", b"$") else message[:5]
+        if len(header) != 5 or not (header.isalpha() and header.isupper()):
+            return False
+
+        # Check the sentence type (without talker ID), bytes sentences are
+        # looked up without decoding them
+        if isinstance(header, bytes):
+            return header[2:] not in self._excluded_sentence_bytes
+        return header.isascii() and header[2:] not in self._excluded_sentences
+
+    def send_nmea(self, message: Union[str, bytes, NMEA2000Message]):
         """
         Send NMEA message(s) in appropriate format.
 
         Args:
-            message: NMEA message to send (string for 0183, NMEA2000Message for 2000)
+            message: NMEA message to send (NMEA 0183 sentence as str or ASCII
+                bytes, or NMEA2000Message for 2000)
         """
         try:
             formatted_messages = self.formatter.format_message(message)
@@ -227,59 +338,53 @@ class MessageService:
                 return
 
             for formatted_message in formatted_messages:
-                if self.version == NMEAVersion.NMEA_2000:
-                    self._send_nmea_2000_message(formatted_message, message)
-                elif self.version == NMEAVersion.NMEA_0183:
-                    self._send_nmea_0183_message(formatted_message, message)
-                else:
-                    raise ValueError(f"Unsupported NMEA version: {self.version}")
+                self._send_formatted_message(formatted_message, message)
 
         except Exception as e:
             logging.error(f"Error sending NMEA message: {e}")
             raise
 
     def _send_nmea_2000_message(
-        self, formatted_message: bytes, original_message: Union[str, NMEA2000Message]
+        self,
+        formatted_message: bytes,
+        original_message: Union[str, bytes, NMEA2000Message],
     ):
         """Handle sending of a single NMEA 2000 message."""
-        if self.formatter.output_format == "ACTISENSE_RAW_ASCII":
-            # For ACTISENSE_RAW_ASCII, just encode and send the ASCII string
-            data = formatted_message
-            log_message = formatted_message.decode("ascii").strip()
-        else:
-            # Handle binary CAN frame formats
-            data = formatted_message
-            verifier = MessageVerifier()
-            frame_info = verifier.verify_can_frame(data)
+        if isinstance(original_message, (str, bytes)):
+            if not self._should_send_sentence(original_message):
+                return
+
+        data = formatted_message
+        log_message = None
+        # ACTISENSE_RAW_ASCII is logged as the ASCII string itself. Binary CAN
+        # frames are decoded for the log only, so skip that entirely unless
+        # debug logging is on.
+        if self.formatter.output_format != "ACTISENSE_RAW_ASCII" and (
+            logging.getLogger().isEnabledFor(logging.DEBUG)
+        ):
+            frame_info = MessageVerifier.verify_can_frame(data)
             log_message = (
                 f"Sending PGN {frame_info['pgn']} "
                 f"({PGN.get_description(frame_info['pgn'])}) Raw bytes: {data.hex()}"
             )
+            if isinstance(original_message, bytes):
+                original_message = original_message.decode("ascii")
             if isinstance(original_message, str):
                 log_message += f" Converted from {original_message.strip()}"
 
-        if isinstance(original_message, str):
-            if not self._should_send_sentence(original_message):
-                return
-
         self._send_data(data, log_message)
 
     def _send_nmea_0183_message(
-        self, formatted_message: str, original_message: Union[str, NMEA2000Message]
+        self,
+        formatted_message: bytearray,
+        original_message: Union[str, bytes, NMEA2000Message],
     ):
         """Handle sending of a single NMEA 0183 message."""
-        if not isinstance(original_message, str):
+        if isinstance(original_message, NMEA2000Message):
             raise ValueError("Conversion from NMEA 2000 to 0183 not supported")
 
-        data = formatted_message
-        # Handle both bytes and string types for log_message
-        if isinstance(formatted_message, bytes):
-            log_message = formatted_message.decode("utf-8").strip()
-        else:
-            log_message = formatted_message.strip()
-
         if self._should_send_sentence(original_message):
-            self._send_data(data, log_message)
+            self._send_data(formatted_message)
 
     def _accept_connections(self):
         """Handle incoming TCP connections in a separate thread"""
@@ -295,13 +400,85 @@ class MessageService:
                 logging.error(f"Error accepting TCP connection: {e}")
                 time.sleep(1)
 
-    def _send_data(self, data: Union[bytes, str], log_message: str):
-        """Send data over the socket with logging."""
+    def begin_batch(self):
+        """
+        Start queueing outgoing messages instead of sending them one by one.
+
+        Batches may be nested, the queued data is sent when the outermost
+        batch ends.
+        """
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """End a batch, sending all queued messages if it is the outermost one."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush_tx()
+
+    def flush_tx(self):
+        """Send all messages queued by the current batch now."""
+        if self._tx_buffer:
+            self._transmit(self._tx_buffer)
+            self._tx_buffer.clear()
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager sending every message queued inside it at once.
+
+        NMEA listeners split the stream on line endings, so several sentences
+        can share one UDP datagram or TCP write. Batching a simulation tick
+        turns one syscall per sentence into one per tick.
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def _send_data(
+        self, data: Union[bytes, bytearray, str], log_message: Optional[str] = None
+    ):
+        """
+        Send data over the socket with logging.
+
+        Args:
+            data: Data to send
+            log_message: Debug log text, defaults to the data itself. Only
+                used when debug logging is enabled.
+        """
         if isinstance(data, str):
             data = data.encode()
 
+        if self._batch_depth:
+            # Flush early rather than let a datagram grow past the path MTU
+            if len(self._tx_buffer) + len(data) > self.max_batch_size:
+                self.flush_tx()
+            self._tx_buffer += data
+        else:
+            self._transmit(data)
+
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            if log_message is None:
+                log_message = data.decode("ascii", "replace").strip()
+            logging.debug("Send NMEA %s: '%s'", self.version.value, log_message)
+
+    def _transmit(self, data: Union[bytes, bytearray]):
+        """Write data to the UDP destination or to all connected TCP clients."""
         if self.protocol == TransportProtocol.UDP:
-            self.sock.sendto(data, (self.host, self.port))
+            # Never let a full send buffer stall the simulation, NMEA data is
+            # periodic so dropping a datagram is better than falling behind
+            try:
+                self.sock.sendto(data, self._address)
+            except BlockingIOError:
+                # Report the first drop and then every so often, a slow
+                # consumer would otherwise flood the log
+                if self.dropped_datagrams % UDP_DROP_LOG_INTERVAL == 0:
+                    logging.warning(
+                        "UDP send buffer full, %d datagram(s) of NMEA data dropped",
+                        self.dropped_datagrams + 1,
+                    )
+                self.dropped_datagrams += 1
         else:  # TCP
             # Send to all connected clients
             disconnected = []
@@ -317,8 +494,6 @@ class MessageService:
                 self.client_sockets.remove(client)
                 client.close()
 
-        logging.debug(f"Send NMEA {self.version.value}: '{log_message}'")
-
     def send_wind_messages(
         self,
         true_wind_speed: float,
@@ -344,23 +519,11 @@ class MessageService:
 
     def send_mwv_true(self, wind_speed: float, wind_direction: float, heading: float):
         """Send MWV sentence for true wind"""
-        # Calculate relative angle to bow
+        # Relative angle to bow, positive (0-360) for NMEA format
         relative_angle = (wind_direction - heading) % 360
-        if relative_angle > 180:
-            relative_angle -= 360
 
-        # Ensure angle is positive (0-360) for NMEA format
-        if relative_angle < 0:
-            relative_angle += 360
-
-        mwv = (
-            f"{self.talker_id}MWV,"
-            f"{relative_angle:.1f},"  # Wind angle
-            f"T,"  # Reference: T (True)
-            f"{wind_speed:.1f},"  # Wind speed
-            f"N,"  # Units: N for knots
-            f"A"  # Status: A for valid data
-        )
+        # Reference T (True), speed in knots, status valid
+        mwv = self._MWV_TRUE_FMT % (self._talker_bytes, relative_angle, wind_speed)
         self.send_nmea(mwv)
 
     def send_mwv_apparent(self, apparent_speed: float, apparent_angle: float):
@@ -369,13 +532,11 @@ class MessageService:
         if apparent_angle < 0:
             apparent_angle += 360
 
-        mwv = (
-            f"{self.talker_id}MWV,"
-            f"{apparent_angle:.1f},"  # Wind angle
-            f"R,"  # Reference: R (Relative/Apparent)
-            f"{apparent_speed:.1f},"  # Wind speed
-            f"N,"  # Units: N for knots
-            f"A"  # Status: A for valid data
+        # Reference R (Relative/Apparent), speed in knots, status valid
+        mwv = self._MWV_APPARENT_FMT % (
+            self._talker_bytes,
+            apparent_angle,
+            apparent_speed,
         )
         self.send_nmea(mwv)
 
@@ -412,22 +573,24 @@ class MessageService:
             dgps_age: Age of DGPS data (empty if not using DGPS)
             dgps_station: DGPS station ID (empty if not using DGPS)
         """
-        now = datetime.now(UTC)
-        timestamp = now.strftime("%H%M%S.00")
+        timestamp = self._get_utc_fields()[0]
+        lat, lon = self._get_position_fields(position["lat"], position["lon"])
 
         # Build the GGA sentence
-        gga = (
-            f"{self.talker_id}GGA,"
-            f"{timestamp},"
-            f"{self.format_lat(position['lat'])},"
-            f"{self.format_lon(position['lon'])},"
-            f"{gps_quality},"
-            f"{satellites_in_use:02d},"  # 00-12 satellites, leading zero
-            f"{hdop:.1f},"
-            f"{altitude:.1f},M,"  # Altitude and units
-            f"{geoid_separation:.1f},M,"  # Geoid separation and units
-            f"{dgps_age},"  # DGPS age (empty if not used)
-            f"{dgps_station}"  # DGPS station ID (empty if not used)
+        # Satellites are zero padded, altitude and geoid separation in meters,
+        # DGPS fields are empty when DGPS is not used
+        gga = self._GGA_FMT % (
+            self._talker_bytes,
+            timestamp,
+            lat,
+            lon,
+            gps_quality,
+            satellites_in_use,
+            hdop,
+            altitude,
+            geoid_separation,
+            dgps_age.encode("ascii"),
+            dgps_station.encode("ascii"),
         )
 
         self.send_nmea(gga)
@@ -460,35 +623,27 @@ class MessageService:
                 S = Simulator
                 N = Data not valid
         """
-        # Get current segment
-        segment = route_manager.get_current_segment()
+        # Calculate XTE for current segment
+        cross_track_error = route_manager.get_cross_track_error(current_position)
 
-        if segment is None:
+        if cross_track_error is None:
             # No active segment, send zero XTE
             xte_magnitude = 0.0
             steer_direction = "L"
         else:
-            # Calculate XTE for current segment
-            xte_magnitude, steer_direction = calculate_cross_track_error(
-                current_position.lat,
-                current_position.lon,
-                segment.start.lat,
-                segment.start.lon,
-                segment.end.lat,
-                segment.end.lon,
-            )
+            xte_magnitude, steer_direction = cross_track_error
 
         # Build the XTE sentence (using NMEA 2.3 format with mode indicator)
-        xte = (
-            f"{self.talker_id}XTE,"
-            f"A,A,"  # Both cyclic and signal status valid
-            f"{xte_magnitude:.3f},"  # XTE magnitude with 3 decimal places for better precision
-            f"{steer_direction},"  # Direction to steer (L/R)
-            f"N"  # Units (Nautical Miles)
+        # Both statuses valid, XTE magnitude with 3 decimal places for better
+        # precision, in nautical miles
+        xte = self._XTE_FMT % (
+            self._talker_bytes,
+            xte_magnitude,
+            steer_direction.encode("ascii"),
         )
         if send_mode_indicator:
             # Add mode indicator if requested
-            xte += ",A"
+            xte += b",A"
 
         self.send_nmea(xte)
 
@@ -505,10 +660,6 @@ class MessageService:
             - x.x,M = depth in meters
             - x.x,F = depth in fathoms
         """
-        # Conversion factors
-        METERS_TO_FEET = 3.28084
-        METERS_TO_FATHOMS = 0.546807
-
         """
         DBT sentence fields are:
         1. Depth in feet
@@ -525,11 +676,11 @@ class MessageService:
         depth_fathoms = depth_meters * METERS_TO_FATHOMS
 
         # Build the DBT sentence with all three measurements
-        dbt = (
-            f"{self.talker_id}DBT,"
-            f"{depth_feet:.1f},f,"  # Depth in feet
-            f"{depth_meters:.1f},M,"  # Depth in meters
-            f"{depth_fathoms:.1f},F"  # Depth in fathoms
+        dbt = self._DBT_FMT % (
+            self._talker_bytes,
+            depth_feet,
+            depth_meters,
+            depth_fathoms,
         )
 
         self.send_nmea(dbt)
@@ -564,18 +715,15 @@ class MessageService:
         """
         if port_rudder is not None:
             # Dual rudder format
-            rsa = (
-                f"{self.talker_id}RSA,"
-                f"{starboard_rudder:.1f},A,"  # Starboard rudder + status
-                f"{port_rudder:.1f},A"  # Port rudder + status
+            rsa = self._RSA_DUAL_FMT % (
+                self._talker_bytes,
+                starboard_rudder,
+                port_rudder,
             )
         else:
             # Single rudder format
-            rsa = (
-                f"{self.talker_id}RSA,"
-                f"{starboard_rudder:.1f},A,"  # Single rudder + status
-                f","  # Empty port rudder fields
-            )
+            # Single rudder format, empty port rudder fields
+            rsa = self._RSA_SINGLE_FMT % (self._talker_bytes, starboard_rudder)
 
         self.send_nmea(rsa)
 
@@ -617,15 +765,15 @@ class MessageService:
         magnetic_heading = (heading + variation) % 360
 
         # Convert water speed to km/h
-        speed_kmh = water_speed * 1.852  # 1 knot = 1.852 km/h
+        speed_kmh = water_speed * KNOTS_TO_KMH
 
         # Build the VHW sentence
-        vhw = (
-            f"{self.talker_id}VHW,"
-            f"{heading:.1f},T,"  # True heading
-            f"{magnetic_heading:.1f},M,"  # Magnetic heading
-            f"{water_speed:.1f},N,"  # Speed in knots
-            f"{speed_kmh:.1f},K"  # Speed in km/h
+        vhw = self._VHW_FMT % (
+            self._talker_bytes,
+            heading,
+            magnetic_heading,
+            water_speed,
+            speed_kmh,
         )
 
         self.send_nmea(vhw)
@@ -666,114 +814,65 @@ class MessageService:
 
         if segment is None:
             # No active waypoint - send empty RMB
-            rmb = (
-                f"{self.talker_id}RMB,A,,"  # Status, no XTE
-                f",,"  # No waypoint IDs
-                f",,"  # No destination lat
-                f",,"  # No destination lon
-                f",,"  # No range
-                f",,"  # No bearing
-                f",,"  # No VMG
-                f"V,N"  # Arrival not valid, data not valid
-            )
+            rmb = self._RMB_EMPTY_FMT % self._talker_bytes
         else:
             # Calculate XTE for current segment
-            xte_magnitude, steer_direction = calculate_cross_track_error(
-                current_position.lat,
-                current_position.lon,
-                segment.start.lat,
-                segment.start.lon,
-                segment.end.lat,
-                segment.end.lon,
+            xte_magnitude, steer_direction = route_manager.get_cross_track_error(
+                current_position
             )
 
             # Calculate range and bearing to destination
-            distance = calculate_distance(
-                current_position.lat,
-                current_position.lon,
-                segment.end.lat,
-                segment.end.lon,
-            )
-
-            bearing = calculate_bearing(
-                current_position.lat,
-                current_position.lon,
-                segment.end.lat,
-                segment.end.lon,
-            )
+            distance, bearing = route_manager.get_range_and_bearing(current_position)
 
             # Calculate VMG (Velocity Made Good) towards waypoint
             vmg = calculate_vmg(sog, bearing, bearing)
 
-            # Format waypoint coordinates for NMEA
-            wp_lat = self.format_lat(segment.end.lat)
-            wp_lon = self.format_lon(segment.end.lon)
-
-            # Previous waypoint ID (if available)
-            from_waypoint = (
-                f"WP{route_manager.current_index-1:03d}"
-                if route_manager.current_index > 0
-                else ""
+            # Waypoint IDs and coordinates only change when the route advances
+            waypoint_key = (
+                route_manager.current_index,
+                segment.end.lat,
+                segment.end.lon,
             )
-
-            # Current waypoint ID
-            to_waypoint = f"WP{route_manager.current_index:03d}"
+            if self._rmb_waypoint_key != waypoint_key:
+                self._rmb_waypoint_key = waypoint_key
+                self._rmb_waypoint_fields = (
+                    # Previous waypoint ID (if available)
+                    (
+                        b"WP%03d" % (route_manager.current_index - 1)
+                        if route_manager.current_index > 0
+                        else b""
+                    ),
+                    # Current waypoint ID
+                    b"WP%03d" % route_manager.current_index,
+                    # Waypoint coordinates formatted for NMEA
+                    self.format_lat(segment.end.lat).encode("ascii"),
+                    self.format_lon(segment.end.lon).encode("ascii"),
+                )
+            from_waypoint, to_waypoint, wp_lat, wp_lon = self._rmb_waypoint_fields
 
             # Determine if we've arrived at waypoint
-            arrival_status = "A" if distance < route_manager.waypoint_threshold else "V"
+            arrival_status = (
+                b"A" if distance < route_manager.waypoint_threshold else b"V"
+            )
 
             # Build the RMB sentence
-            rmb = (
-                f"{self.talker_id}RMB,"
-                f"A,"  # Data status (A=valid)
-                f"{xte_magnitude:.1f},"  # Cross Track Error
-                f"{steer_direction},"  # Direction to steer (L/R)
-                f"{from_waypoint},"  # FROM Waypoint ID
-                f"{to_waypoint},"  # TO Waypoint ID
-                f"{wp_lat},"  # Destination Waypoint Latitude
-                f"{wp_lon},"  # Destination Waypoint Longitude
-                f"{distance:.1f},"  # Range to destination
-                f"{bearing:.1f},"  # Bearing to destination
-                f"{vmg:.1f},"  # Destination closing velocity (VMG)
-                f"{arrival_status},"  # Arrival Status
-                f"A"  # Navigation Status (A=valid)
+            # Data status and navigation status are always valid (A)
+            rmb = self._RMB_FMT % (
+                self._talker_bytes,
+                xte_magnitude,
+                steer_direction.encode("ascii"),
+                from_waypoint,
+                to_waypoint,
+                wp_lat,
+                wp_lon,
+                distance,
+                bearing,
+                vmg,
+                arrival_status,
             )
 
         self.send_nmea(rmb)
 
-    def send_mwv(self, is_true: bool):
-        """
-        Send MWV (Wind Speed and Angle) sentence.
-        Format: $--MWV,x.x,a,x.x,a,A*hh
-        Fields: wind angle, reference (R/T), wind speed, wind speed units, status
-        """
-        if is_true:
-            # For true wind, calculate angle relative to bow
-            relative_angle = (self.true_wind_direction - self.heading) % 360
-            if relative_angle > 180:
-                relative_angle -= 360
-            wind_speed = self.true_wind_speed
-            reference = "T"
-        else:
-            # For apparent wind, use calculated apparent values
-            relative_angle = self.apparent_wind_angle
-            wind_speed = self.apparent_wind_speed
-            reference = "R"
-
-        # Ensure angle is positive (0-360) for NMEA format
-        if relative_angle < 0:
-            relative_angle += 360
-
-        mwv = (
-            f"{self.talker_id}MWV,"
-            f"{relative_angle:.1f},"  # Wind angle
-            f"{reference},"  # Reference: R (Relative/Apparent) or T (True)
-            f"{wind_speed:.1f},"  # Wind speed
-            f"N,"  # Units: N for knots
-            f"A"  # Status: A for valid data
-        )
-        self.send_nmea(mwv)
-
     def send_mwd(
         self, true_wind_speed: float, true_wind_direction: float, variation: float
     ):
@@ -809,14 +908,14 @@ class MessageService:
         magnetic_wind_dir = (true_wind_direction + variation) % 360
 
         # Convert wind speed to m/s
-        wind_speed_ms = true_wind_speed * 0.514444  # Convert knots to m/s
-
-        mwd = (
-            f"{self.talker_id}MWD,"
-            f"{true_wind_direction:.1f},T,"  # True wind direction
-            f"{magnetic_wind_dir:.1f},M,"  # Magnetic wind direction
-            f"{true_wind_speed:.1f},N,"  # Wind speed in knots
-            f"{wind_speed_ms:.1f},M"  # Wind speed in m/s
+        wind_speed_ms = true_wind_speed * KNOTS_TO_MS
+
+        mwd = self._MWD_FMT % (
+            self._talker_bytes,
+            true_wind_direction,
+            magnetic_wind_dir,
+            true_wind_speed,
+            wind_speed_ms,
         )
         self.send_nmea(mwd)
 
@@ -838,33 +937,53 @@ class MessageService:
             heading: Heading in degrees true
             variation: Magnetic variation in degrees (East negative)
         """
-        now = datetime.now(UTC)
-        timestamp = now.strftime("%H%M%S.00")
-        date = now.strftime("%d%m%y")
+        timestamp, date = self._get_utc_fields()
+        lat, lon = self._get_position_fields(position["lat"], position["lon"])
 
         # RMC - Recommended Minimum Navigation Information
-        rmc = (
-            f"{self.talker_id}RMC,{timestamp},A,"
-            f"{self.format_lat(position['lat'])},"
-            f"{self.format_lon(position['lon'])},"
-            f"{sog:.1f},{cog:.1f},{date},"
-            f"{abs(variation):.1f},{'E' if variation >= 0 else 'W'},,A"
+        rmc = self._RMC_FMT % (
+            self._talker_bytes,
+            timestamp,
+            lat,
+            lon,
+            sog,
+            cog,
+            date,
+            abs(variation),
+            b"E" if variation >= 0 else b"W",
         )
         self.send_nmea(rmc)
 
         # HDT - Heading True from gyrocompass
-        hdt = f"{self.talker_id}HDT,{heading:.1f},T"
+        hdt = self._HDT_FMT % (self._talker_bytes, heading)
         self.send_nmea(hdt)
 
         # HDM - Heading Magnetic from magnetic compass
         magnetic_heading = (heading + variation) % 360
-        hdm = f"{self.talker_id}HDM,{magnetic_heading:.1f},M"
+        hdm = self._HDM_FMT % (self._talker_bytes, magnetic_heading)
         self.send_nmea(hdm)
 
         # HDG - Heading with variation/deviation
-        hdg = f"{self.talker_id}HDG,{heading:.1f},0.0,E,{abs(variation):.1f},W"
+        hdg = self._HDG_FMT % (self._talker_bytes, heading, abs(variation))
         self.send_nmea(hdg)
 
+    def _get_utc_fields(self) -> Tuple[bytes, bytes]:
+        """
+        Get the current UTC time and date as NMEA fields.
+
+        Returns:
+            Tuple[bytes, bytes]: (time as hhmmss.00, date as ddmmyy)
+        """
+        second = int(time.time())
+        if second != self._utc_second:
+            utc = time.gmtime(second)
+            self._utc_fields = (
+                b"%02d%02d%02d.00" % (utc.tm_hour, utc.tm_min, utc.tm_sec),
+                b"%02d%02d%02d" % (utc.tm_mday, utc.tm_mon, utc.tm_year % 100),
+            )
+            self._utc_second = second
+        return self._utc_fields
+
     def close(self):
         """Close all sockets"""
         if self.protocol == TransportProtocol.TCP:
@@ -887,19 +1006,23 @@ class MessageService:
         Returns:
             Two-character hex string of checksum
         """
-        # Start from character after $ or ! until * (or end of string)
-        start = 1  # Skip first character ($ or !)
-        end = sentence.find("*")
-        if end == -1:  # If no * found, process whole string
-            end = len(sentence)
+        return sentence_checksum(sentence)
 
-        # XOR all characters between start and end
-        checksum = 0
-        for char in sentence[start:end]:
-            checksum ^= ord(char)
+    def _get_position_fields(self, lat: float, lon: float) -> Tuple[bytes, bytes]:
+        """
+        Get the vessel position as NMEA latitude and longitude fields.
 
-        # Return two-character hex string
-        return f"{checksum:02X}"
+        Returns:
+            Tuple[bytes, bytes]: (ddmm.mmm,N/S latitude, dddmm.mmm,E/W longitude)
+        """
+        key = (lat, lon)
+        if key != self._position_key:
+            self._position_fields = (
+                self.format_lat(lat).encode("ascii"),
+                self.format_lon(lon).encode("ascii"),
+            )
+            self._position_key = key
+        return self._position_fields
 
     def format_lat(self, lat):
         """Convert decimal degrees to NMEA ddmm.mmm,N/S format"""
@@ -907,7 +1030,7 @@ class MessageService:
         lat = abs(lat)
         degrees = int(lat)
         minutes = (lat - degrees) * 60
-        return f"{degrees:02d}{minutes:06.3f},{hemisphere}"
+        return self._LAT_FMT % (degrees, minutes, hemisphere)
 
     def format_lon(self, lon):
         """Convert decimal degrees to NMEA dddmm.mmm,E/W format"""
@@ -915,4 +1038,4 @@ class MessageService:
         lon = abs(lon)
         degrees = int(lon)
         minutes = (lon - degrees) * 60
-        return f"{degrees:03d}{minutes:06.3f},{hemisphere}"
+        return self._LON_FMT % (degrees, minutes, hemisphere)
@@ -1,50 +1,125 @@
 # src/services/nmea2000/converter.py
 import math
 import struct
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 import logging
 from typing import List, Optional
-from math import floor
 
+from nmea_simulator.utils.navigation_utils import TWO_PI
 from .messages import NMEA2000Message
 from .pgns import PGN
+from .utils import KNOTS_TO_MS
+
+# Unit conversion factors
+_DEG_TO_RAD = math.pi / 180.0
+_KNOTS_TO_CMS = KNOTS_TO_MS * 100  # knots to cm/s
+
+# Largest value of a signed 16-bit PGN field
+_INT16_MAX = 32767
+
+# Precompiled PGN payload layouts, so the format strings are parsed once
+# rather than on every conversion
+_SYSTEM_TIME_STRUCT = struct.Struct("<BBHIh")  # PGN 126992
+_POSITION_RAPID_STRUCT = struct.Struct("<II")  # PGN 129025
+_COG_SOG_RAPID_STRUCT = struct.Struct("<BBHH")  # PGN 129026
+_GNSS_POSITION_STRUCT = struct.Struct("<BBHqqiHBBB")  # PGN 129029
+_WATER_DEPTH_STRUCT = struct.Struct("<BBIH")  # PGN 128267
+_WIND_DATA_STRUCT = struct.Struct("<BBHHh")  # PGN 130306 from MWV
+_MWD_WIND_DATA_STRUCT = struct.Struct("<BBhh")  # PGN 130306 from MWD
+_XTE_STRUCT = struct.Struct("<BBBii")  # PGN 129283
+_VESSEL_HEADING_STRUCT = struct.Struct("<BBhhh")  # PGN 127250
+_NAVIGATION_DATA_STRUCT = struct.Struct("<BBBBiiiihhhh")  # PGN 129284
+_SPEED_STRUCT = struct.Struct("<BBhh")  # PGN 128259
+_RUDDER_STRUCT = struct.Struct("<BBhh")  # PGN 127245
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@lru_cache(maxsize=8)
+def _days_since_epoch(year: int, month: int, day: int) -> int:
+    """
+    Days from 1970-01-01 to the given date, as sent in System Time.
+
+    Cached because consecutive RMC sentences almost always share a date.
+    """
+    return date(year, month, day).toordinal() - _EPOCH_ORDINAL
+
+
+def _parse_ddmm(value: str, hemisphere: str) -> float:
+    """
+    Convert an NMEA 0183 DDMM.MMM or DDDMM.MMM coordinate to decimal degrees.
+
+    The whole degrees and minutes are parsed as one integer and split with
+    divmod, only the fractional minutes go through float().
+
+    Args:
+        value: Coordinate field
+        hemisphere: N, S, E or W, southern and western values are negative
+
+    Returns:
+        float: Signed decimal degrees
+
+    Raises:
+        ValueError: If the field is not a valid coordinate
+    """
+    point = value.find(".")
+    if point == -1:
+        ddmm = int(value)
+        fraction = 0.0
+    else:
+        ddmm = int(value[:point])
+        # A trailing point with no digits, as in "4807.", has no fraction
+        fraction = float(value[point:]) if point + 1 < len(value) else 0.0
+    degrees, minutes = divmod(ddmm, 100)
+    decimal = degrees + (minutes + fraction) / 60
+    return -decimal if hemisphere in ("S", "W") else decimal
+
+
+def _parse_ddmm_e7(value: str, hemisphere: str) -> int:
+    """
+    Convert an NMEA 0183 DDMM.MMM or DDDMM.MMM coordinate to 1e-7 degrees.
+
+    Works on integers only, so the result is the exact value truncated
+    toward zero. Minute fractions beyond seven digits are ignored.
+
+    Args:
+        value: Coordinate field
+        hemisphere: N, S, E or W, southern and western values are negative
+
+    Returns:
+        int: Signed coordinate in 1e-7 degrees
+
+    Raises:
+        ValueError: If the field is not a valid coordinate
+    """
+    point = value.find(".")
+    if point == -1:
+        ddmm = int(value)
+        fraction = 0
+    else:
+        ddmm = int(value[:point])
+        # Fractional minutes scaled to 1e-7 minutes
+        digits = value[point + 1 : point + 8]
+        fraction = int(digits.ljust(7, "0")) if digits else 0
+    degrees, minutes = divmod(ddmm, 100)
+    e7 = degrees * 10_000_000 + (minutes * 10_000_000 + fraction) // 60
+    return -e7 if hemisphere in ("S", "W") else e7
 
 
 class NMEA2000Converter:
     """Converts NMEA 0183 messages to NMEA 2000 format"""
 
-    def _parse_lat_lon(
-        self, lat_str: str, lat_dir: str, lon_str: str, lon_dir: str
-    ) -> tuple:
-        """Helper to parse NMEA 0183 lat/lon format"""
-        try:
-            # Convert DDMM.MMM to decimal degrees
-            lat_deg = floor(float(lat_str) / 100)
-            lat_min = float(lat_str) - (lat_deg * 100)
-            lat = lat_deg + (lat_min / 60)
-            if lat_dir == "S":
-                lat = -lat
-
-            lon_deg = floor(float(lon_str) / 100)
-            lon_min = float(lon_str) - (lon_deg * 100)
-            lon = lon_deg + (lon_min / 60)
-            if lon_dir == "W":
-                lon = -lon
-
-            return lat, lon
-        except (ValueError, TypeError):
-            return 0.0, 0.0
-
     def _get_message_type(self, message: str) -> str:
         """Extract message type without talker ID from NMEA 0183 message"""
         if not message:
             return ""
 
         # Handle messages with or without $ prefix
-        msg = message[1:] if message.startswith("$") else message
+        msg = message[1:] if message[:1] == "$" else message
 
-        # Split on comma and get sentence identifier
-        parts = msg.split(",")[0]
+        # Sentence identifier is everything before the first comma
+        parts = msg.split(",", 1)[0]
 
         # Get everything after the talker ID (which is 2 characters)
         if len(parts) > 2:
@@ -55,10 +130,10 @@ class NMEA2000Converter:
     def convert_rmc_to_2000(self, message: str) -> List[NMEA2000Message]:
         """Convert RMC message to NMEA 2000 messages."""
         messages = []
-        logging.debug(f"Converting RMC message: {message}")
+        logging.debug("Converting RMC message: %s", message)
         fields = message.split(",")
         if len(fields) < 12:
-            logging.warning(f"RMC message has insufficient fields: {len(fields)}")
+            logging.warning("RMC message has insufficient fields: %d", len(fields))
             return messages
 
         try:
@@ -74,29 +149,35 @@ class NMEA2000Converter:
             month = int(date_str[2:4])
             year = 2000 + int(date_str[4:6])  # Assuming 20xx
 
-            # Parse position
-            lat, lon = self._parse_lat_lon(fields[3], fields[4], fields[5], fields[6])
-
-            # Clamp latitude to valid range and convert to unsigned integer
-            lat = max(-90, min(90, lat))
-            lat_int = int((lat * 1e7) % 4294967296)  # Handle unsigned 32-bit wraparound
-
-            # Handle longitude wraparound and convert to unsigned integer
-            lon = ((lon + 180) % 360) - 180
-            lon_int = int((lon * 1e7) % 4294967296)  # Handle unsigned 32-bit wraparound
+            # Parse position in 1e-7 degrees, invalid positions are sent as 0,0
+            try:
+                lat = _parse_ddmm_e7(fields[3], fields[4])
+                lon = _parse_ddmm_e7(fields[5], fields[6])
+            except ValueError:
+                lat = lon = 0
+
+            # Clamp latitude to valid range and convert to unsigned integer.
+            # Valid sentences never need the clamp or the longitude wrap, so
+            # only out of range values pay for them.
+            if not -900_000_000 <= lat <= 900_000_000:
+                lat = 900_000_000 if lat > 0 else -900_000_000
+            lat_int = lat & 0xFFFFFFFF  # Handle unsigned 32-bit wraparound
+
+            # Handle longitude wraparound into [-180, 180) and convert to
+            # unsigned integer
+            if not -1_800_000_000 <= lon < 1_800_000_000:
+                lon = ((lon + 1_800_000_000) % 3_600_000_000) - 1_800_000_000
+            lon_int = lon & 0xFFFFFFFF  # Handle unsigned 32-bit wraparound
 
             # Parse speed and course
             sog = float(fields[7]) if fields[7] else 0.0
             cog = float(fields[8]) if fields[8] else 0.0
 
             # System Time (PGN 126992)
-            dt = datetime(year, month, day)
-            epoch = datetime(1970, 1, 1)
-            days_since_epoch = (dt - epoch).days
+            days_since_epoch = _days_since_epoch(year, month, day)
             msecs = (hour * 3600 + minute * 60 + second) * 1000
 
-            time_data = struct.pack(
-                "<BBHIh",
+            time_data = _SYSTEM_TIME_STRUCT.pack(
                 0xFF,  # SID (not used)
                 0,  # Time Source (0 = GPS)
                 days_since_epoch,
@@ -104,7 +185,18 @@ class NMEA2000Converter:
                 0,  # Reserved
             )
             logging.debug(
-                f"System Time data: {year}-{month}-{day} {hour}:{minute}:{second}. SOG={sog}kts, COG={cog}°. position: lat={lat}, lon={lon}"
+                "System Time data: %d-%d-%d %d:%d:%d. SOG=%skts, COG=%s°. "
+                "position: lat=%d, lon=%d (1e-7 degrees)",
+                year,
+                month,
+                day,
+                hour,
+                minute,
+                second,
+                sog,
+                cog,
+                lat,
+                lon,
             )
             messages.append(
                 NMEA2000Message(
@@ -117,8 +209,8 @@ class NMEA2000Converter:
             )
 
             # Position Rapid Update (PGN 129025)
-            pos_data = struct.pack(
-                "<II",  # Use unsigned integers for lat/lon
+            # Unsigned integers for lat/lon
+            pos_data = _POSITION_RAPID_STRUCT.pack(
                 lat_int,  # Latitude in 1e-7 degrees
                 lon_int,  # Longitude in 1e-7 degrees
             )
@@ -135,15 +227,13 @@ class NMEA2000Converter:
 
             # COG & SOG, Rapid Update (PGN 129026)
             # Convert COG to radians (NMEA 2000 PGN 129026 uses radians)
-            cog_rad = (cog * math.pi / 180.0) % (2 * math.pi)
+            cog_rad = (cog * _DEG_TO_RAD) % TWO_PI
             cog_int = int(cog_rad * 10000)  # Scale to 1/10000th radian
 
             # Convert SOG from knots to 1/100th m/s
-            # 1 knot = 0.514444 m/s
-            sog_ms100 = int(sog * 0.514444 * 100)  # Scale to 0.01 m/s
+            sog_ms100 = int(sog * _KNOTS_TO_CMS)  # Scale to 0.01 m/s
 
-            cog_sog_data = struct.pack(
-                "<BBHH",
+            cog_sog_data = _COG_SOG_RAPID_STRUCT.pack(
                 0xFF,  # SID (not used)
                 0xFC,  # COG Reference (true=0) with upper bits set to 1 like OpenCPN
                 cog_int,  # COG in 1/10000th radian
@@ -157,66 +247,18 @@ class NMEA2000Converter:
                 data=cog_sog_data,
             )
             messages.append(cog_sog_msg)
-            logging.debug(f"COG: {cog}° -> {cog_rad:.4f} rad -> {cog_int} (scaled)")
-            logging.debug(f"SOG: {sog} knots -> {sog_ms100} 0.01 m/s")
-            logging.debug(f"COG/SOG raw data: {cog_sog_data.hex()}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(
+                    "COG: %s° -> %.4f rad -> %d (scaled)", cog, cog_rad, cog_int
+                )
+                logging.debug("SOG: %s knots -> %d 0.01 m/s", sog, sog_ms100)
+                logging.debug("COG/SOG raw data: %s", cog_sog_data.hex())
 
             return messages
 
         except (ValueError, IndexError) as e:
             raise ValueError(f"Error converting RMC: {e}")
 
-    def _create_system_time_message(
-        self, year: int, month: int, day: int, hour: int, minute: int, second: int
-    ) -> NMEA2000Message:
-        """Create System Time message (PGN 126992)"""
-        # Calculate days since Unix epoch
-        dt = datetime(year, month, day)
-        epoch = datetime(1970, 1, 1)
-        days_since_epoch = (dt - epoch).days
-
-        # Calculate seconds since midnight
-        seconds = hour * 3600 + minute * 60 + second
-
-        data = struct.pack(
-            "<BBHHI",
-            0xFF,  # SID (not used)
-            0,  # Time Source (0 = GPS)
-            days_since_epoch,
-            seconds * 10000,  # Milliseconds since midnight
-            0,  # Reserved
-        )
-
-        return NMEA2000Message(
-            pgn=PGN.SYSTEM_TIME, priority=3, source=0, destination=255, data=data
-        )
-
-    def _create_position_message(self, lat: float, lon: float) -> NMEA2000Message:
-        """Create Position Rapid Update message (PGN 129025)"""
-        data = struct.pack(
-            "<ll",
-            int(lat * 1e7),  # Latitude in 1e-7 degrees
-            int(lon * 1e7),  # Longitude in 1e-7 degrees
-        )
-
-        return NMEA2000Message(
-            pgn=PGN.POSITION_RAPID, priority=2, source=0, destination=255, data=data
-        )
-
-    def _create_cog_sog_message(self, cog: float, sog: float) -> NMEA2000Message:
-        """Create COG & SOG Rapid Update message (PGN 129026)"""
-        data = struct.pack(
-            "<BBHH",
-            0xFF,  # SID (not used)
-            0,  # COG Reference (0 = True)
-            int(cog * 10000),  # COG in 10000th of a degree
-            int(sog * 100),  # SOG in 100th of a knot
-        )
-
-        return NMEA2000Message(
-            pgn=PGN.COG_SOG_RAPID, priority=2, source=0, destination=255, data=data
-        )
-
     def convert_gga_to_2000(self, message: str) -> NMEA2000Message:
         """Convert GGA message to NMEA 2000 GNSS Position Data (PGN 129029)"""
         fields = message.split(",")
@@ -225,37 +267,22 @@ class NMEA2000Converter:
 
         try:
             time = fields[1]
-            lat = float(fields[2]) if fields[2] else 0.0
-            lat_dir = fields[3]
-            lon = float(fields[4]) if fields[4] else 0.0
-            lon_dir = fields[5]
+            # Convert DDMM.MMM to 1e-7 degrees
+            lat = _parse_ddmm_e7(fields[2], fields[3]) if fields[2] else 0
+            lon = _parse_ddmm_e7(fields[4], fields[5]) if fields[4] else 0
             quality = int(fields[6]) if fields[6] else 0
             satellites = int(fields[7]) if fields[7] else 0
             hdop = float(fields[8]) if fields[8] else 0.0
             altitude = float(fields[9]) if fields[9] else 0.0
 
-            # Convert DDMM.MMM to decimal degrees
-            lat_deg = floor(lat / 100)
-            lat_min = lat - (lat_deg * 100)
-            lat = lat_deg + (lat_min / 60)
-            if lat_dir == "S":
-                lat = -lat
-
-            lon_deg = floor(lon / 100)
-            lon_min = lon - (lon_deg * 100)
-            lon = lon_deg + (lon_min / 60)
-            if lon_dir == "W":
-                lon = -lon
-
             # Pack GNSS data using proper integer types
             # Use q (long long) for larger lat/lon values
-            data = struct.pack(
-                "<BBHqqiHBBB",
+            data = _GNSS_POSITION_STRUCT.pack(
                 0xFF,  # SID (not used)
                 0xFF,  # Days since 1970 (not used)
                 0,  # Time of position (seconds since midnight)
-                int(lat * 1e7),  # Latitude
-                int(lon * 1e7),  # Longitude
+                lat,  # Latitude
+                lon,  # Longitude
                 int(altitude * 100),  # Altitude in centimeters
                 satellites & 0xFFFF,  # Number of SVs
                 quality & 0xFF,  # Method/Quality
@@ -286,22 +313,18 @@ class NMEA2000Converter:
             # Convert to 0.01m units
             depth_value = int(depth * 100)
 
-            # Pack bytes manually to ensure correct order
-            data = bytes(
-                [
-                    0xFF,  # SID
-                    0x00,  # Source type
-                    depth_value & 0xFF,  # Depth byte 0
-                    (depth_value >> 8) & 0xFF,  # Depth byte 1
-                    (depth_value >> 16) & 0xFF,  # Depth byte 2
-                    (depth_value >> 24) & 0xFF,  # Depth byte 3
-                    0x00,  # Offset LSB
-                    0x00,  # Offset MSB
-                ]
+            data = _WATER_DEPTH_STRUCT.pack(
+                0xFF,  # SID
+                0x00,  # Source type
+                depth_value & 0xFFFFFFFF,  # Depth, little-endian 32 bits
+                0,  # Offset
             )
 
-            logging.debug(f"Converting depth {depth}m to raw value {depth_value}")
-            logging.debug(f"Raw data bytes: {' '.join([f'{b:02X}' for b in data])}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(
+                    "Converting depth %sm to raw value %d", depth, depth_value
+                )
+                logging.debug("Raw data bytes: %s", data.hex(" ").upper())
 
             return NMEA2000Message(
                 pgn=PGN.WATER_DEPTH, priority=3, source=0, destination=255, data=data
@@ -320,15 +343,14 @@ class NMEA2000Converter:
             wind_angle = float(fields[1]) if fields[1] else 0.0
             wind_speed = float(fields[3]) if fields[3] else 0.0
 
-            # Convert wind speed from knots to m/s (1 knot = 0.514444 m/s)
-            wind_speed_ms = wind_speed * 0.514444
+            # Convert wind speed from knots to m/s
+            wind_speed_ms = wind_speed * KNOTS_TO_MS
 
             # Reference: 0=true, 2=apparent
             reference = 0 if is_true else 2
 
             # Pack wind data using unsigned short (H) for angle and speed
-            data = struct.pack(
-                "<BBHHh",
+            data = _WIND_DATA_STRUCT.pack(
                 0xFF,  # SID (not used)
                 reference,  # Wind reference
                 int(wind_speed_ms * 100) & 0xFFFF,  # Wind speed in 0.01 m/s
@@ -377,8 +399,7 @@ class NMEA2000Converter:
             magnitude_meters = magnitude * 1852  # 1 nautical mile = 1852 meters
 
             # Pack XTE data
-            data = struct.pack(
-                "<BBBii",
+            data = _XTE_STRUCT.pack(
                 0xFF,  # SID (not used)
                 0xFF,  # XTE mode (not used)
                 0,  # Reserved
@@ -395,9 +416,10 @@ class NMEA2000Converter:
 
     def _clamp_heading(self, heading: float) -> int:
         """Clamp heading to valid range and convert to 1/10000th degree"""
-        heading = heading % 360  # Normalize to 0-360
-        # Convert to 1/10000th degree and ensure within 16-bit range
-        return min(32767, max(-32768, int(heading * 10000)))
+        # Normalize to 0-360 and convert to 1/10000th degree. The result is
+        # never negative, so only the upper end of the 16-bit range can be hit.
+        value = int((heading % 360) * 10000)
+        return value if value < _INT16_MAX else _INT16_MAX
 
     def convert_heading_to_2000(self, message: str) -> NMEA2000Message:
         """
@@ -426,7 +448,7 @@ class NMEA2000Converter:
                 # Parse variation
                 if len(fields) > 4 and fields[4]:
                     variation = float(fields[4])
-                    if fields[5].startswith("W"):
+                    if fields[5][:1] == "W":
                         variation = -variation
 
             # Clamp values to valid ranges
@@ -434,9 +456,8 @@ class NMEA2000Converter:
             deviation_value = self._clamp_heading(deviation)
             variation_value = self._clamp_heading(variation)
 
-            # Pack heading data
-            data = struct.pack(
-                "<BBhhh",  # Changed to signed short (h) for all angular values
+            # Pack heading data, signed short (h) for all angular values
+            data = _VESSEL_HEADING_STRUCT.pack(
                 0xFF,  # SID (not used)
                 reference & 0xFF,  # Reference (0=True, 1=Magnetic)
                 heading_value,  # Heading in 1/10000th of a degree
@@ -477,11 +498,10 @@ class NMEA2000Converter:
             xte_cm = int(xte * 100 * 185200)  # Convert NM to cm
             distance_cm = int(distance * 100 * 185200)  # Convert NM to cm
             bearing_val = self._clamp_heading(bearing)
-            vmg_cms = int(vmg * 51.4444)  # Convert knots to cm/s
+            vmg_cms = int(vmg * _KNOTS_TO_CMS)  # Convert knots to cm/s
 
             # Pack navigation data
-            data = struct.pack(
-                "<BBBBiiiihhhh",
+            data = _NAVIGATION_DATA_STRUCT.pack(
                 0xFF,  # SID (not used)
                 0x01,  # Distance to waypoint reference (1 = Great Circle)
                 0x00,  # Perpendicular crossed (0 = Not crossed)
@@ -519,12 +539,11 @@ class NMEA2000Converter:
             # Get speed through water in knots
             speed = float(fields[5]) if fields[5] else 0.0
 
-            # Convert to centimeters/second (1 knot = 51.4444 cm/s)
-            speed_cms = int(speed * 51.4444)
+            # Convert to centimeters/second
+            speed_cms = int(speed * _KNOTS_TO_CMS)
 
             # Pack speed data
-            data = struct.pack(
-                "<BBhh",  # Changed format to match NMEA 2000 spec
+            data = _SPEED_STRUCT.pack(
                 0xFF,  # SID (not used)
                 0x00,  # Speed reference (0 = Paddle wheel)
                 speed_cms,  # Speed through water
@@ -556,8 +575,7 @@ class NMEA2000Converter:
             port_val = self._clamp_heading(port)
 
             # Pack rudder data
-            data = struct.pack(
-                "<BBhh",  # Simplified format to match actual NMEA 2000 spec
+            data = _RUDDER_STRUCT.pack(
                 0xFF,  # SID (not used)
                 0x00,  # Rudder instance (0 = Main)
                 starboard_val,  # Direction order (positive = starboard)
@@ -584,16 +602,15 @@ class NMEA2000Converter:
             wind_dir = float(fields[1]) if fields[1] else 0.0
             wind_speed = float(fields[5]) if fields[5] else 0.0
 
-            # Convert wind speed to m/s (1 knot = 0.514444 m/s)
-            wind_speed_ms = wind_speed * 0.514444
+            # Convert wind speed to m/s
+            wind_speed_ms = wind_speed * KNOTS_TO_MS
 
             # Clamp values to valid ranges
             wind_dir_val = self._clamp_heading(wind_dir)
             wind_speed_val = min(32767, max(-32768, int(wind_speed_ms * 100)))
 
             # Pack wind data
-            data = struct.pack(
-                "<BBhh",  # Simplified format to match NMEA 2000 spec
+            data = _MWD_WIND_DATA_STRUCT.pack(
                 0xFF,  # SID (not used)
                 0x00,  # Wind reference (0 = True)
                 wind_speed_val,  # Wind speed in 0.01 m/s
@@ -612,10 +629,7 @@ class NMEA2000Converter:
         if not lat:
             return 0.0
         try:
-            degrees = float(lat[:2])
-            minutes = float(lat[2:])
-            decimal = degrees + minutes / 60.0
-            return -decimal if ns == "S" else decimal
+            return _parse_ddmm(lat, ns)
         except (ValueError, IndexError):
             return 0.0
 
@@ -624,9 +638,6 @@ class NMEA2000Converter:
         if not lon:
             return 0.0
         try:
-            degrees = float(lon[:3])
-            minutes = float(lon[3:])
-            decimal = degrees + minutes / 60.0
-            return -decimal if ew == "W" else decimal
+            return _parse_ddmm(lon, ew)
         except (ValueError, IndexError):
             return 0.0
@@ -4,7 +4,6 @@ from typing import List, Union, Optional
 from .messages import NMEA2000Message
 from .converter import NMEA2000Converter
 from .verifier import verify_pgn_conversion
-from .pgns import PGN
 
 # See OpenCPN/model/src/comm_drv_n2k_net.cpp
 # CommDriverN2KNet::OnSocketEvent() for details
@@ -29,24 +28,42 @@ class NMEA2000Formatter:
             output_format: One of "ACTISENSE_RAW_ASCII", "ACTISENSE_N2K_ASCII", or "MINIPLEX"
         """
         self.converter = NMEA2000Converter()
+        # Conversion method for each supported NMEA 0183 sentence type, bound
+        # once here rather than looked up by name for every message
+        self._converters = {
+            "HDT": self.converter.convert_heading_to_2000,
+            "HDM": self.converter.convert_heading_to_2000,
+            "HDG": self.converter.convert_heading_to_2000,
+            "RMC": self.converter.convert_rmc_to_2000,
+            "GGA": self.converter.convert_gga_to_2000,
+            "DBT": self.converter.convert_dbt_to_2000,
+            "MWV": self.converter.convert_mwv_to_2000,
+            "XTE": self.converter.convert_xte_to_2000,
+            "RMB": self.converter.convert_rmb_to_2000,
+            "VHW": self.converter.convert_vhw_to_2000,
+            "RSA": self.converter.convert_rsa_to_2000,
+            "MWD": self.converter.convert_mwd_to_2000,
+        }
         if output_format is None:
             output_format = N2K_ACTISENSE_RAW_ASCII
         self.output_format = output_format
 
     def format_message(
-        self, message: Union[str, NMEA2000Message, List[NMEA2000Message]]
+        self, message: Union[str, bytes, NMEA2000Message, List[NMEA2000Message]]
     ) -> List[bytes]:
         """Format NMEA 2000 message(s) into a list of formatted byte messages.
 
         Args:
             message: Input message(s) to format. Can be:
-                - NMEA 0183 string to convert and format
+                - NMEA 0183 string or ASCII bytes to convert and format
                 - Single NMEA 2000 message
                 - List of NMEA 2000 messages
 
         Returns:
             List of formatted messages as bytes. Empty list if no valid messages.
         """
+        if isinstance(message, bytes):
+            message = message.decode("ascii")
         if isinstance(message, str):
             nmea2000_msg = self._convert_0183_to_2000(message)
         else:
@@ -93,7 +110,7 @@ class NMEA2000Formatter:
             raise NotImplementedError("MINIPLEX format not yet supported")
         else:
             raise ValueError(f"Unsupported output format: {self.output_format}")
-        logging.debug(f"Message PGN {nmea2000_msg.pgn}: {msg}")
+        logging.debug("Message PGN %d: %s", nmea2000_msg.pgn, msg)
         return msg
 
     def convert_to_actisense_raw_ascii(
@@ -138,7 +155,7 @@ class NMEA2000Formatter:
         # HH:MM:SS.mmm R 18F11200 08 FF 00 00 00 00 00 00
         message = (
             f"{timestamp} {tx_flag} {can_id:08X} "
-            + " ".join(f"{byte:02X}" for byte in data_bytes)
+            + bytes(data_bytes).hex(" ").upper()
             + "\r\n"
         )
 
@@ -175,12 +192,12 @@ class NMEA2000Formatter:
         field1 = f"{source:02X}{destination:02X}{priority:01X}"
 
         # Format data as hex string
-        data_hex = "".join(f"{b:02X}" for b in data)
+        data_hex = bytes(data).hex().upper()
 
         # Build complete message
         message = f"A{timestamp} {field1} {pgn:05X} {data_hex}\r\n"
 
-        logging.debug(f"Formatted N2K ASCII message: {message.strip()}")
+        logging.debug("Formatted N2K ASCII message: %s", message[:-2])
         return message.encode("ascii")
 
     def _get_message_type(self, message: str) -> str:
@@ -189,10 +206,10 @@ class NMEA2000Formatter:
             return ""
 
         # Handle messages with or without $ prefix
-        msg = message[1:] if message.startswith("$") else message
+        msg = message[1:] if message[:1] == "$" else message
 
-        # Split on comma and get sentence identifier
-        parts = msg.split(",")[0]
+        # Sentence identifier is everything before the first comma
+        parts = msg.split(",", 1)[0]
 
         # Get everything after the talker ID (which is 2 characters)
         if len(parts) > 2:
@@ -204,33 +221,12 @@ class NMEA2000Formatter:
         """Convert NMEA 0183 message to NMEA 2000 format"""
         try:
             msg_type = self._get_message_type(message)
+            convert_func = self._converters.get(msg_type)
 
-            # Message type conversion mapping
-            conversion_map = {
-                "HDT": ("convert_heading_to_2000", PGN.VESSEL_HEADING),
-                "HDM": ("convert_heading_to_2000", PGN.VESSEL_HEADING),
-                "HDG": ("convert_heading_to_2000", PGN.VESSEL_HEADING),
-                "RMC": (
-                    "convert_rmc_to_2000",
-                    [PGN.SYSTEM_TIME, PGN.POSITION_RAPID, PGN.COG_SOG_RAPID],
-                ),
-                "GGA": ("convert_gga_to_2000", PGN.GNSS_POSITION),
-                "DBT": ("convert_dbt_to_2000", PGN.WATER_DEPTH),
-                "MWV": ("convert_mwv_to_2000", PGN.WIND_DATA),
-                "XTE": ("convert_xte_to_2000", PGN.XTE),
-                "RMB": ("convert_rmb_to_2000", PGN.NAVIGATION_DATA),
-                "VHW": ("convert_vhw_to_2000", PGN.SPEED),
-                "RSA": ("convert_rsa_to_2000", PGN.RUDDER),
-                "MWD": ("convert_mwd_to_2000", PGN.WIND_DATA),
-            }
-
-            if msg_type in conversion_map:
-                converter_method, expected_pgns = conversion_map[msg_type]
-                convert_func = getattr(self.converter, converter_method)
-
+            if convert_func is not None:
                 # Handle special cases
                 if msg_type == "MWV":
-                    is_true = message.split(",")[2] == "T"
+                    is_true = message.split(",", 3)[2] == "T"
                     result = convert_func(message, is_true)
                 else:
                     result = convert_func(message)
@@ -269,9 +265,13 @@ class NMEA2000Formatter:
                 raise ValueError(f"Source address must be 0-255, got {message.source}")
 
             logging.debug(
-                f"Formatting NMEA 2000 Message: PGN {message.pgn}, Priority {message.priority}, "
-                f"Source {message.source}, Destination {message.destination}, "
-                f"Data Length {len(message.data)}"
+                "Formatting NMEA 2000 Message: PGN %d, Priority %d, "
+                "Source %d, Destination %d, Data Length %d",
+                message.pgn,
+                message.priority,
+                message.source,
+                message.destination,
+                len(message.data),
             )
 
             # Extract PDU Format (PF) - upper byte of PGN
@@ -336,14 +336,15 @@ class NMEA2000Formatter:
         frame.extend(data)
 
         # Enhanced debug logging
-        logging.debug(f"CAN Frame Construction Details:")
-        logging.debug(f"  CAN ID: {hex(can_id)}")
-        logging.debug(f"  Priority: {priority}")
-        logging.debug(f"  PDU Format (PF): {pf}")
-        logging.debug(f"  PDU Specific (PS): {ps}")
-        logging.debug(f"  Source Address: {source}")
-        logging.debug(f"  Data Length: {len(data)}")
-        logging.debug(f"  Raw Bytes: {frame.hex()}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("CAN Frame Construction Details:")
+            logging.debug("  CAN ID: %s", hex(can_id))
+            logging.debug("  Priority: %d", priority)
+            logging.debug("  PDU Format (PF): %d", pf)
+            logging.debug("  PDU Specific (PS): %d", ps)
+            logging.debug("  Source Address: %d", source)
+            logging.debug("  Data Length: %d", len(data))
+            logging.debug("  Raw Bytes: %s", frame.hex())
 
         return bytes(frame)
 
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from .pgns import PGN
 
 
-@dataclass
+@dataclass(slots=True)
 class NMEA2000Message:
     """NMEA 2000 message structure"""
 
@@ -47,7 +47,7 @@ class NMEA2000Message:
 
             else:
                 # For unknown or unhandled PGNs, show first few bytes as hex
-                return "Data: " + " ".join([f"{b:02X}" for b in self.data[:8]])
+                return "Data: " + self.data[:8].hex(" ").upper()
 
         except Exception as e:
             return f"Error parsing data: {e}"
@@ -3,8 +3,9 @@
 import math
 from typing import Tuple
 
+from nmea_simulator.utils.navigation_utils import KNOTS_TO_MS
+
 # Constants
-KNOTS_TO_MS = 0.514444
 RADIAN_SCALE = 65535 / (2 * math.pi)  # For converting radians to 16-bit unsigned
 POSITION_SCALE = 1e7  # For lat/lon conversion (1e-7 degree resolution)
 
@@ -1,16 +1,17 @@
 import logging
 import math
+import random
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Literal, Optional, Tuple, Union
 
 from nmea_simulator.utils.navigation_utils import (
+    TWO_PI,
     calculate_water_speed,
     update_vessel_position,
 )
 from nmea_simulator.utils.vessel_dynamics import RudderState
 from nmea_simulator.utils.weather_utils import calculate_apparent_wind
-from nmea_simulator.utils.coordinate_utils import calculate_cross_track_error
 
 from .models.ais_manager import AISManager, AISVessel
 from .models.environment import EnvironmentManager
@@ -97,10 +98,8 @@ class BasicNavSimulator:
         }
 
         # Random phase offsets for more realistic fluctuations
-        import random
-
-        self._low_freq_phase_offset = random.uniform(0, 2 * math.pi)
-        self._high_freq_phase_offset = random.uniform(0, 2 * math.pi)
+        self._low_freq_phase_offset = random.uniform(0, TWO_PI)
+        self._high_freq_phase_offset = random.uniform(0, TWO_PI)
 
         self._heading_offset = 0.0  # Current heading offset from desired course
         self._last_heading_update = 0.0  # Timestamp of last heading fluctuation update
@@ -179,6 +178,9 @@ class BasicNavSimulator:
         # Main simulation loop
         start_time = time.time()
         last_update = start_time
+        # Ticks are scheduled on fixed deadlines so the time spent building and
+        # sending messages does not stretch the update period
+        next_tick = time.monotonic()
 
         try:
             while True:
@@ -192,15 +194,25 @@ class BasicNavSimulator:
                     logging.info("Simulation duration reached")
                     break
 
-                # Update simulation state
-                if not self._update_simulation_state(current_time, last_update):
-                    break
+                # Send everything produced during this tick together
+                with self.message_service.batch():
+                    # Update simulation state
+                    if not self._update_simulation_state(current_time, last_update):
+                        break
 
-                # Send NMEA messages
-                self._send_nmea_messages()
+                    # Send NMEA messages
+                    self._send_nmea_messages()
 
                 last_update = current_time
-                time.sleep(update_rate)
+
+                next_tick += update_rate
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Running late, start the next tick now instead of
+                    # bursting to catch up on missed ones
+                    next_tick -= delay
 
         except KeyboardInterrupt:
             logging.info("Simulation stopped by user")
@@ -351,11 +363,18 @@ class BasicNavSimulator:
 
     def _log_state(self):
         """Log current simulation state"""
+        # Runs every tick, skip the waypoint distance and formatting when the
+        # message would be discarded anyway
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
         logging.info(
-            f"Position: {self.position['lat']:.6f}, {self.position['lon']:.6f}. "
-            f"Heading: {self.heading:.2f}°. "
-            f"Distance to WP: {self.route_manager.get_distance_to_next_waypoint(Position(**self.position)):.3f}nm. "
-            f"SOG: {self.sog:.2f}kts"
+            "Position: %.6f, %.6f. Heading: %.2f°. Distance to WP: %.3fnm. "
+            "SOG: %.2fkts",
+            self.position["lat"],
+            self.position["lon"],
+            self.heading,
+            self.route_manager.get_distance_to_next_waypoint(Position(**self.position)),
+            self.sog,
         )
 
     def configure_heading_fluctuations(
@@ -399,10 +418,8 @@ class BasicNavSimulator:
             self.fluctuation_config["random"] = {"amplitude": 1.0}
 
         # Reset phase offsets for new configuration
-        import random
-
-        self._low_freq_phase_offset = random.uniform(0, 2 * math.pi)
-        self._high_freq_phase_offset = random.uniform(0, 2 * math.pi)
+        self._low_freq_phase_offset = random.uniform(0, TWO_PI)
+        self._high_freq_phase_offset = random.uniform(0, TWO_PI)
 
         self._heading_offset = 0.0
         self._last_heading_update = 0.0
@@ -423,31 +440,20 @@ class BasicNavSimulator:
         if not self.enable_heading_fluctuations:
             return desired_course
 
-        # Get current route segment for XTE calculation
-        current_segment = self.route_manager.get_current_segment()
-        if not current_segment:
+        # Calculate current cross-track error on the active route segment
+        current_pos = Position(lat=self.position["lat"], lon=self.position["lon"])
+        cross_track_error = self.route_manager.get_cross_track_error(current_pos)
+        if cross_track_error is None:
             logging.debug("No current segment available for XTE calculation")
             return desired_course
-
-        # Calculate current cross-track error
-        current_pos = Position(lat=self.position["lat"], lon=self.position["lon"])
-        xte_magnitude, xte_direction = calculate_cross_track_error(
-            current_pos.lat,
-            current_pos.lon,
-            current_segment.start.lat,
-            current_segment.start.lon,
-            current_segment.end.lat,
-            current_segment.end.lon,
-        )
+        xte_magnitude, xte_direction = cross_track_error
 
         # Generate multi-frequency fluctuation pattern
-        import random
-
         # Low frequency component (long-term drift) with phase offset
         low_freq_config = self.fluctuation_config["low_frequency"]
         low_frequency_fluctuation = (
             math.sin(
-                2 * math.pi * current_time / low_freq_config["period"]
+                TWO_PI * current_time / low_freq_config["period"]
                 + self._low_freq_phase_offset
             )
             * low_freq_config["amplitude"]
@@ -457,7 +463,7 @@ class BasicNavSimulator:
         high_freq_config = self.fluctuation_config["high_frequency"]
         high_frequency_fluctuation = (
             math.sin(
-                2 * math.pi * current_time / high_freq_config["period"]
+                TWO_PI * current_time / high_freq_config["period"]
                 + self._high_freq_phase_offset
             )
             * high_freq_config["amplitude"]
@@ -517,11 +523,18 @@ class BasicNavSimulator:
 
         # Enhanced logging for debugging
         logging.debug(
-            f"Heading fluctuation: XTE={xte_magnitude:.4f}nm ({xte_direction}), "
-            f"desired={desired_course:.1f}°, fluctuation={total_fluctuation:.1f}°, "
-            f"adjusted={adjusted_course:.1f}°, correction_applied={correction_applied}, "
-            f"low_freq={low_frequency_fluctuation:.1f}°, high_freq={high_frequency_fluctuation:.1f}°, "
-            f"random={random_component:.1f}°"
+            "Heading fluctuation: XTE=%.4fnm (%s), desired=%.1f°, "
+            "fluctuation=%.1f°, adjusted=%.1f°, correction_applied=%s, "
+            "low_freq=%.1f°, high_freq=%.1f°, random=%.1f°",
+            xte_magnitude,
+            xte_direction,
+            desired_course,
+            total_fluctuation,
+            adjusted_course,
+            correction_applied,
+            low_frequency_fluctuation,
+            high_frequency_fluctuation,
+            random_component,
         )
 
         return adjusted_course
@@ -3,11 +3,17 @@
 from .coordinate_utils import (
     parse_coordinate,
     calculate_distance,
+    calculate_distances,
     calculate_bearing,
+    calculate_bearings,
+    calculate_distance_and_bearing,
 )
 
 __all__ = [
     "parse_coordinate",
     "calculate_distance",
+    "calculate_distances",
     "calculate_bearing",
+    "calculate_bearings",
+    "calculate_distance_and_bearing",
 ]
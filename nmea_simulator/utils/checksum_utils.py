@@ -0,0 +1,53 @@
+from functools import reduce
+from operator import xor
+
+# Below this length folding through a big integer costs more than it saves
+_WORD_FOLD_MIN_LENGTH = 32
+_WORD_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def xor_checksum(data: bytes, checksum: int = 0) -> int:
+    """
+    XOR all bytes of data together, as used by NMEA 0183 sentence checksums.
+
+    Long inputs are XORed eight bytes at a time by reading them as one
+    integer, which is faster than a per-byte loop for typical sentences.
+
+    Args:
+        data: Bytes covered by the checksum
+        checksum: Checksum of any preceding bytes, to continue from
+
+    Returns:
+        int: Checksum value (0-255)
+    """
+    if len(data) < _WORD_FOLD_MIN_LENGTH:
+        return reduce(xor, data, checksum)
+
+    value = int.from_bytes(data, "little")
+    while value:
+        checksum ^= value & _WORD_MASK
+        value >>= 64
+    # Fold the 64-bit word down to a single byte
+    checksum ^= checksum >> 32
+    checksum ^= checksum >> 16
+    checksum ^= checksum >> 8
+    return checksum & 0xFF
+
+
+def sentence_checksum(sentence: str) -> str:
+    """
+    Calculate the checksum of an NMEA sentence string.
+
+    Covers the characters after the leading '$' or '!' up to the '*', or to
+    the end of the sentence if it has no '*'.
+
+    Args:
+        sentence: NMEA sentence string
+
+    Returns:
+        str: Two-character uppercase hex checksum
+    """
+    end = sentence.find("*")
+    if end == -1:
+        end = len(sentence)
+    return "%02X" % xor_checksum(sentence[1:end].encode("ascii"))
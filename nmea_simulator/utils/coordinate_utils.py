@@ -1,6 +1,16 @@
 import math
-import re
-from typing import Tuple, Union
+from functools import lru_cache
+from typing import NamedTuple, Tuple, Union
+
+import numpy as np
+
+_DIRECTIONS = frozenset("NSEW")
+
+
+def _is_unsigned_decimal(token: str) -> bool:
+    """Check for digits with at most one decimal point, such as "40" or "40.35"."""
+    whole, _, fraction = token.partition(".")
+    return whole.isdecimal() and (not fraction or fraction.isdecimal())
 
 
 def parse_coordinate(coord: Union[str, float, int]) -> float:
@@ -19,33 +29,44 @@ def parse_coordinate(coord: Union[str, float, int]) -> float:
     """
     if isinstance(coord, (float, int)):
         return float(coord)
+    return _parse_coordinate_string(coord)
 
-    # Remove special characters and extra spaces
+
+@lru_cache(maxsize=1024)
+def _parse_coordinate_string(coord: str) -> float:
+    """Parse a coordinate string, memoized since routes reuse the same strings."""
+    # Remove special characters; split() also collapses extra spaces
     clean_coord = coord.replace("°", " ").replace("'", " ").replace('"', " ")
-    clean_coord = " ".join(clean_coord.split())
 
-    # Try to parse different formats
     try:
-        # Check for directional format first
-        match = re.match(r"^(-?\d+\.?\d*)\s*([NSEW])$", clean_coord)
-        if match:
-            value = float(match.group(1))
-            direction = match.group(2)
-            return -value if direction in ["W", "S"] else value
-
-        # Check for degrees decimal minutes format
-        match = re.match(r"^(-?\d+)\s+(\d+\.?\d*)\s*([NSEW])$", clean_coord)
-        if match:
-            degrees = float(match.group(1))
-            minutes = float(match.group(2))
-            direction = match.group(3)
-            value = degrees + minutes / 60
-            return -value if direction in ["W", "S"] else value
+        parts = clean_coord.split()
+        # The direction letter may be its own token or attached to the number
+        if parts and parts[-1][-1] in _DIRECTIONS:
+            direction = parts[-1][-1]
+            parts[-1] = parts[-1][:-1]
+            if not parts[-1]:
+                parts.pop()
+
+            # Only plain decimal numbers are accepted here, float() and int()
+            # alone would also take "nan", "1e3" or "+5"
+            if len(parts) == 1 and _is_unsigned_decimal(parts[0].removeprefix("-")):
+                # Directional format
+                value = float(parts[0])
+            elif (
+                len(parts) == 2
+                and parts[0].removeprefix("-").isdecimal()
+                and _is_unsigned_decimal(parts[1])
+            ):
+                # Degrees decimal minutes format
+                value = int(parts[0]) + float(parts[1]) / 60
+            else:
+                raise ValueError(f"Unexpected format: {clean_coord}")
+            return -value if direction in "WS" else value
 
         # Try simple float conversion
-        return float(clean_coord)
+        return float(" ".join(parts))
 
-    except (ValueError, AttributeError) as e:
+    except ValueError as e:
         raise ValueError(f"Unable to parse coordinate: {coord}") from e
 
 
@@ -59,10 +80,24 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
         math.sin(dlat / 2) ** 2
         + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
     )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    # Rounding can push a marginally above 1 for near antipodal points
+    c = 2 * math.asin(math.sqrt(min(a, 1.0)))
     return R * c
 
 
+def calculate_distances(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """Vectorized calculate_distance over arrays of points, in nautical miles"""
+    R = 3440.065  # Earth's radius in nautical miles
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return R * 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
 def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate true bearing between two points"""
     lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
@@ -71,68 +106,190 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> flo
     x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(
         dlon
     )
-    bearing = math.degrees(math.atan2(y, x))
-    return (bearing + 360) % 360
+    # Float modulo by a positive number is never negative, no need to add 360
+    return math.degrees(math.atan2(y, x)) % 360
 
 
-def calculate_cross_track_error(
-    current_lat: float,
-    current_lon: float,
-    start_lat: float,
-    start_lon: float,
-    end_lat: float,
-    end_lon: float,
-) -> Tuple[float, str]:
+def calculate_distance_and_bearing(
+    lat1: float, lon1: float, lat2: float, lon2: float
+) -> Tuple[float, float]:
     """
-    Calculate cross track error between current position and route leg.
-    Assumes valid input coordinates - validation should be done before calling.
+    Calculate distance and true bearing between two points together.
+
+    Shares the radian conversions and the cosines of both latitudes between
+    calculate_distance and calculate_bearing, results are identical to the
+    separate functions.
+
+    Returns:
+        Tuple[float, float]: (distance in nautical miles, bearing in degrees true)
+    """
+    R = 3440.065  # Earth's radius in nautical miles
+    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    cos_lat1 = math.cos(lat1)
+    cos_lat2 = math.cos(lat2)
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = math.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * math.sin(dlon / 2) ** 2
+    # Rounding can push a marginally above 1 for near antipodal points
+    distance = R * (2 * math.asin(math.sqrt(min(a, 1.0))))
+    y = math.sin(dlon) * cos_lat2
+    x = cos_lat1 * math.sin(lat2) - math.sin(lat1) * cos_lat2 * math.cos(dlon)
+    return distance, math.degrees(math.atan2(y, x)) % 360
+
+
+def calculate_bearings(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """Vectorized calculate_bearing over arrays of points, in degrees true"""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    dlon = lon2 - lon1
+    y = np.sin(dlon) * np.cos(lat2)
+    x = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon)
+    return np.degrees(np.arctan2(y, x)) % 360
+
+
+class LegGeometry(NamedTuple):
+    """Cross track error terms of a route leg that do not depend on position"""
+
+    lat1: float  # Start latitude in radians
+    lon1: float  # Start longitude in radians
+    sin_lat1: float
+    cos_lat1: float
+    bearing12: float  # Initial bearing from start to end in radians
+    cross_lon: float  # sin(lon2 - lon1) * cos(lat2)
+    cross_lat: float  # sin(lat2 - lat1)
+    lat2: float  # End latitude in radians
+    lon2: float  # End longitude in radians
+    sin_lat2: float
+    cos_lat2: float
+
+
+def calculate_leg_geometry(
+    start_lat: float, start_lon: float, end_lat: float, end_lon: float
+) -> LegGeometry:
+    """
+    Precompute the parts of the cross track error that only depend on the leg.
 
     Args:
-        current_lat: Current position latitude in decimal degrees
-        current_lon: Current position longitude in decimal degrees
         start_lat: Route start point latitude in decimal degrees
         start_lon: Route start point longitude in decimal degrees
         end_lat: Route end point latitude in decimal degrees
         end_lon: Route end point longitude in decimal degrees
 
     Returns:
-        Tuple[float, str]: (XTE magnitude in nautical miles, direction to steer 'L' or 'R')
+        LegGeometry: Terms to pass to calculate_leg_cross_track_error
+    """
+    lat1, lon1 = math.radians(start_lat), math.radians(start_lon)
+    lat2, lon2 = math.radians(end_lat), math.radians(end_lon)
+    sin_lat1 = math.sin(lat1)
+    cos_lat1 = math.cos(lat1)
+    sin_lat2 = math.sin(lat2)
+    cos_lat2 = math.cos(lat2)
+
+    # Calculate initial bearing from start to end waypoint
+    cross_lon = math.sin(lon2 - lon1) * cos_lat2
+    x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * math.cos(lon2 - lon1)
+    bearing12 = math.atan2(cross_lon, x)
+
+    return LegGeometry(
+        lat1,
+        lon1,
+        sin_lat1,
+        cos_lat1,
+        bearing12,
+        cross_lon,
+        math.sin(lat2 - lat1),
+        lat2,
+        lon2,
+        sin_lat2,
+        cos_lat2,
+    )
+
+
+def calculate_leg_navigation(
+    current_lat: float, current_lon: float, leg: LegGeometry
+) -> Tuple[float, float, float, str]:
     """
-    # Convert to radians for calculations
-    lat1, lon1 = map(math.radians, [start_lat, start_lon])
-    lat2, lon2 = map(math.radians, [end_lat, end_lon])
-    lat3, lon3 = map(math.radians, [current_lat, current_lon])
+    Calculate range, bearing and cross track error for a precomputed leg.
+
+    Fuses calculate_distance and calculate_bearing to the leg end point with
+    the cross track error, so the trigonometry of the current position and of
+    the leg end points is only evaluated once. Results are identical to the
+    separate functions.
 
-    # Calculate distances and bearings
+    Args:
+        current_lat: Current position latitude in decimal degrees
+        current_lon: Current position longitude in decimal degrees
+        leg: Route leg from calculate_leg_geometry
+
+    Returns:
+        Tuple[float, float, float, str]: (distance to leg end in nautical miles,
+            bearing to leg end in degrees true, XTE magnitude in nautical miles,
+            direction to steer 'L' or 'R')
+    """
+    R = 3440.065  # Earth's radius in nautical miles
+    lat3, lon3 = math.radians(current_lat), math.radians(current_lon)
+    sin_lat3 = math.sin(lat3)
+    cos_lat3 = math.cos(lat3)
+
+    # Distance and bearing from current position to leg end
+    dlat = leg.lat2 - lat3
+    dlon = leg.lon2 - lon3
+    a = math.sin(dlat / 2) ** 2 + cos_lat3 * leg.cos_lat2 * math.sin(dlon / 2) ** 2
+    # Rounding can push a marginally above 1 for near antipodal points
+    distance = R * (2 * math.asin(math.sqrt(min(a, 1.0))))
+    y = math.sin(dlon) * leg.cos_lat2
+    x = cos_lat3 * leg.sin_lat2 - sin_lat3 * leg.cos_lat2 * math.cos(dlon)
+    bearing = math.degrees(math.atan2(y, x)) % 360
+
+    xte, direction = _leg_cross_track_error(lat3, lon3, sin_lat3, cos_lat3, leg)
+    return distance, bearing, xte, direction
+
+
+def calculate_leg_cross_track_error(
+    current_lat: float, current_lon: float, leg: LegGeometry
+) -> Tuple[float, str]:
+    """
+    Calculate cross track error between current position and a precomputed leg.
+
+    Args:
+        current_lat: Current position latitude in decimal degrees
+        current_lon: Current position longitude in decimal degrees
+        leg: Route leg from calculate_leg_geometry
+
+    Returns:
+        Tuple[float, str]: (XTE magnitude in nautical miles,
+            direction to steer 'L' or 'R')
+    """
+    lat3, lon3 = math.radians(current_lat), math.radians(current_lon)
+    return _leg_cross_track_error(lat3, lon3, math.sin(lat3), math.cos(lat3), leg)
+
+
+def _leg_cross_track_error(
+    lat3: float, lon3: float, sin_lat3: float, cos_lat3: float, leg: LegGeometry
+) -> Tuple[float, str]:
+    """Cross track error of a position given in radians along with its sin/cos"""
     try:
+        dlon13 = lon3 - leg.lon1
+        sin_dlon13 = math.sin(dlon13)
+        cos_dlon13 = math.cos(dlon13)
+
         # Calculate initial bearing from start to current position
-        y = math.sin(lon3 - lon1) * math.cos(lat3)
-        x = math.cos(lat1) * math.sin(lat3) - math.sin(lat1) * math.cos(
-            lat3
-        ) * math.cos(lon3 - lon1)
+        y = sin_dlon13 * cos_lat3
+        x = leg.cos_lat1 * sin_lat3 - leg.sin_lat1 * cos_lat3 * cos_dlon13
         bearing13 = math.atan2(y, x)
 
-        # Calculate initial bearing from start to end waypoint
-        y = math.sin(lon2 - lon1) * math.cos(lat2)
-        x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(
-            lat2
-        ) * math.cos(lon2 - lon1)
-        bearing12 = math.atan2(y, x)
-
         # Calculate distance from start to current position
-        d13 = math.acos(
-            math.sin(lat1) * math.sin(lat3)
-            + math.cos(lat1) * math.cos(lat3) * math.cos(lon3 - lon1)
-        )
+        d13 = math.acos(leg.sin_lat1 * sin_lat3 + leg.cos_lat1 * cos_lat3 * cos_dlon13)
 
         # Convert to nautical miles
         R = 3440.065  # Earth's radius in nautical miles
-        xte = abs(math.asin(math.sin(d13) * math.sin(bearing13 - bearing12)) * R)
+        xte = abs(math.asin(math.sin(d13) * math.sin(bearing13 - leg.bearing12)) * R)
 
         # Determine direction to steer
-        cross_prod = math.sin(lon2 - lon1) * math.cos(lat2) * (
-            math.sin(lat3) - math.sin(lat1)
-        ) - math.sin(lat2 - lat1) * (math.sin(lon3 - lon1) * math.cos(lat3))
+        cross_prod = leg.cross_lon * (sin_lat3 - leg.sin_lat1) - leg.cross_lat * (
+            sin_dlon13 * cos_lat3
+        )
 
         direction = "L" if cross_prod < 0 else "R"
 
@@ -142,3 +299,33 @@ def calculate_cross_track_error(
         direction = "L"
 
     return xte, direction
+
+
+def calculate_cross_track_error(
+    current_lat: float,
+    current_lon: float,
+    start_lat: float,
+    start_lon: float,
+    end_lat: float,
+    end_lon: float,
+) -> Tuple[float, str]:
+    """
+    Calculate cross track error between current position and route leg.
+    Assumes valid input coordinates - validation should be done before calling.
+
+    When the leg is reused across calls, precompute it once with
+    calculate_leg_geometry and use calculate_leg_cross_track_error instead.
+
+    Args:
+        current_lat: Current position latitude in decimal degrees
+        current_lon: Current position longitude in decimal degrees
+        start_lat: Route start point latitude in decimal degrees
+        start_lon: Route start point longitude in decimal degrees
+        end_lat: Route end point latitude in decimal degrees
+        end_lon: Route end point longitude in decimal degrees
+
+    Returns:
+        Tuple[float, str]: (XTE magnitude in nautical miles, direction to steer 'L' or 'R')
+    """
+    leg = calculate_leg_geometry(start_lat, start_lon, end_lat, end_lon)
+    return calculate_leg_cross_track_error(current_lat, current_lon, leg)
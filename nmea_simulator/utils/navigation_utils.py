@@ -2,7 +2,7 @@ from dataclasses import dataclass
 import math
 from typing import Dict, Tuple
 
-from nmea_simulator.utils.coordinate_utils import calculate_bearing, calculate_distance
+from nmea_simulator.utils.coordinate_utils import calculate_distance_and_bearing
 from .vessel_dynamics import (
     calculate_vessel_dynamics,
     update_rudder_angle,
@@ -10,6 +10,25 @@ from .vessel_dynamics import (
     VesselDynamics,
 )
 
+KNOTS_TO_MS = 0.514444  # 1 knot = 0.514444 m/s
+TWO_PI = 2 * math.pi
+EARTH_RADIUS_M = 6371000.0  # Earth radius in meters
+# Degrees of latitude per meter of northing, folds the radius and the radian
+# conversion into a single multiply
+DEGREES_PER_METER = 180.0 / (math.pi * EARTH_RADIUS_M)
+
+
+def _current_vector(speed: float, direction: float) -> Tuple[float, float]:
+    """
+    Split a current into east/north components.
+
+    Most simulations run without any current, so skip the trig in that case.
+    """
+    if not speed:
+        return 0.0, 0.0
+    direction_rad = math.radians(direction)
+    return speed * math.sin(direction_rad), speed * math.cos(direction_rad)
+
 
 def update_vessel_position(
     current_position: Dict[str, float],
@@ -60,32 +79,27 @@ def update_vessel_position(
     new_heading = dynamics.heading
 
     # Convert speeds to meters per second
-    speed_ms = speed * 0.514444  # Convert knots to m/s
-    current_speed_ms = current_speed * 0.514444
-
-    # Convert angles to radians
-    heading_rad = math.radians(new_heading)
-    current_dir_rad = math.radians(current_direction)
+    speed_ms = speed * KNOTS_TO_MS
+    current_speed_ms = current_speed * KNOTS_TO_MS
 
     # Calculate ship movement vector based on actual heading
+    heading_rad = math.radians(new_heading)
     ship_dx = speed_ms * math.sin(heading_rad)
     ship_dy = speed_ms * math.cos(heading_rad)
 
     # Calculate current vector
-    current_dx = current_speed_ms * math.sin(current_dir_rad)
-    current_dy = current_speed_ms * math.cos(current_dir_rad)
+    current_dx, current_dy = _current_vector(current_speed_ms, current_direction)
 
     # Combined movement vector (ship + current)
     total_dx = (ship_dx - current_dx) * delta_time
     total_dy = (ship_dy - current_dy) * delta_time
 
-    # Convert to angular distances
-    R = 6371000  # Earth radius in meters
-    lat_rad = math.radians(current_position["lat"])
-
-    # Calculate position changes
-    dlat = math.degrees(total_dy / R)
-    dlon = math.degrees(total_dx / (R * math.cos(lat_rad)))
+    # Calculate position changes, a degree of longitude shrinks with the
+    # cosine of the latitude
+    dlat = total_dy * DEGREES_PER_METER
+    dlon = (
+        total_dx * DEGREES_PER_METER / math.cos(math.radians(current_position["lat"]))
+    )
 
     # Create new position
     new_position = {
@@ -117,9 +131,9 @@ def calculate_vmg(speed: float, course: float, destination_bearing: float) -> fl
     Returns:
         float: VMG in knots (positive towards destination, negative away)
     """
-    # VMG = SOG * cos(COG - BRG)
-    angle_diff = math.radians(abs(course - destination_bearing))
-    return speed * math.cos(angle_diff)
+    # VMG = SOG * cos(COG - BRG), cos is even so the sign of the difference
+    # does not matter
+    return speed * math.cos(math.radians(course - destination_bearing))
 
 
 @dataclass
@@ -146,25 +160,26 @@ def calculate_water_speed(
     Returns:
         WaterSpeedVector: Speed and direction through water
     """
-    # Convert angles to radians
-    vessel_dir_rad = math.radians(cog)
-    current_dir_rad = math.radians(current_direction)
+    # Without current the water vector is the ground vector, skip the round
+    # trip through vector components
+    if not current_speed and sog >= 0:
+        return WaterSpeedVector(sog, cog % 360)
 
     # Convert speeds and directions to vectors
     # Vessel vector (SOG)
+    vessel_dir_rad = math.radians(cog)
     vx = sog * math.sin(vessel_dir_rad)
     vy = sog * math.cos(vessel_dir_rad)
 
     # Current vector
-    cx = current_speed * math.sin(current_dir_rad)
-    cy = current_speed * math.cos(current_dir_rad)
+    cx, cy = _current_vector(current_speed, current_direction)
 
     # Subtract current vector to get water speed vector
     wx = vx - cx
     wy = vy - cy
 
     # Calculate water speed magnitude
-    speed = math.sqrt(wx * wx + wy * wy)
+    speed = math.hypot(wx, wy)
 
     # Calculate direction through water
     direction = math.degrees(math.atan2(wx, wy)) % 360
@@ -187,8 +202,7 @@ def calculate_course_to_position(
     Returns:
         Tuple[float, float]: (bearing in degrees true, distance in nautical miles)
     """
-    distance = calculate_distance(current_lat, current_lon, target_lat, target_lon)
-
-    bearing = calculate_bearing(current_lat, current_lon, target_lat, target_lon)
-
+    distance, bearing = calculate_distance_and_bearing(
+        current_lat, current_lon, target_lat, target_lon
+    )
     return bearing, distance
@@ -30,33 +30,20 @@ def calculate_apparent_wind(
     Returns:
         WindData: Contains apparent wind speed and angle
     """
-    # Convert angles to radians
-    true_wind_dir_rad = math.radians(true_wind_direction)
-    vessel_heading_rad = math.radians(vessel_heading)
+    # Work in the vessel frame (y along the bow) so that only the wind angle
+    # relative to the heading needs trigonometry
+    relative_dir_rad = math.radians(true_wind_direction - vessel_heading)
 
-    # Convert true wind to vector components
-    true_wind_x = true_wind_speed * math.sin(true_wind_dir_rad)
-    true_wind_y = true_wind_speed * math.cos(true_wind_dir_rad)
-
-    # Convert vessel motion to vector components
-    vessel_x = vessel_speed * math.sin(vessel_heading_rad)
-    vessel_y = vessel_speed * math.cos(vessel_heading_rad)
-
-    # Calculate apparent wind components by subtracting vessel motion
-    apparent_x = true_wind_x - vessel_x
-    apparent_y = true_wind_y - vessel_y
+    # True wind components relative to the bow, minus the vessel motion which
+    # is straight ahead in this frame
+    apparent_x = true_wind_speed * math.sin(relative_dir_rad)
+    apparent_y = true_wind_speed * math.cos(relative_dir_rad) - vessel_speed
 
     # Calculate apparent wind speed
-    apparent_speed = math.sqrt(apparent_x**2 + apparent_y**2)
-
-    # Calculate apparent wind angle relative to vessel heading
-    apparent_angle_rad = math.atan2(apparent_x, apparent_y) - vessel_heading_rad
+    apparent_speed = math.hypot(apparent_x, apparent_y)
 
-    # Convert to degrees and normalize to -180 to +180
-    apparent_angle = math.degrees(apparent_angle_rad)
-    if apparent_angle > 180:
-        apparent_angle -= 360
-    elif apparent_angle < -180:
-        apparent_angle += 360
+    # Apparent wind angle relative to the bow, atan2 already returns it
+    # within -180 to +180
+    apparent_angle = math.degrees(math.atan2(apparent_x, apparent_y))
 
     return WindData(apparent_speed, apparent_angle)
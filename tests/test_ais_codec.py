@@ -0,0 +1,43 @@
+import unittest
+
+from nmea_simulator.models.ais_codec import (
+    encode_payload,
+    encode_sixbit_text,
+    pack_fields,
+)
+
+
+class TestPackFields(unittest.TestCase):
+    def test_packs_fields_most_significant_first(self):
+        self.assertEqual(
+            pack_fields(((6, 1), (2, 3), (4, 0xA))), (0b000001_11_1010, 12)
+        )
+
+    def test_signed_values_are_twos_complement(self):
+        self.assertEqual(pack_fields(((8, -1), (4, -2))), (0xFFE, 12))
+
+
+class TestEncodeSixbitText(unittest.TestCase):
+    def test_pads_short_text_with_spaces(self):
+        self.assertEqual(encode_sixbit_text("AB", 3), (1 << 12) | (2 << 6) | 32)
+
+    def test_keeps_leading_characters_of_long_text(self):
+        self.assertEqual(
+            encode_sixbit_text("PACIFIC TRADER EXPRESS LINE", 20),
+            encode_sixbit_text("PACIFIC TRADER EXPRE", 20),
+        )
+        self.assertEqual(
+            encode_sixbit_text("ABCDEFGHIJ", 7), encode_sixbit_text("ABCDEFG", 7)
+        )
+
+
+class TestEncodePayload(unittest.TestCase):
+    def test_armors_both_character_ranges(self):
+        self.assertEqual(encode_payload(0b100111_101000, 12), "W`")
+
+    def test_pads_odd_character_count(self):
+        self.assertEqual(encode_payload(0b000001_111111_1, 13), "1wP")
+
+
+if __name__ == "__main__":
+    unittest.main()
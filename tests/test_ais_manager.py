@@ -0,0 +1,51 @@
+import unittest
+
+from nmea_simulator.models.ais_manager import AISManager
+from nmea_simulator.models.ais_vessel import AISVessel
+
+
+class RecordingMessageService:
+    def __init__(self):
+        self.sent = []
+
+    def _send_data(self, data, log_message=None):
+        self.sent.append(data)
+
+
+class TestAISManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = AISManager(update_interval=10.0, static_interval=60.0)
+        self.manager.add_vessel(
+            AISVessel(
+                mmsi=366999001,
+                vessel_name="PACIFIC TRADER",
+                position={"lat": 37.8, "lon": -122.45},
+                course=245.3,
+                speed=12.7,
+            )
+        )
+        self.service = RecordingMessageService()
+
+    def sent_types(self):
+        # Message type is the first payload character: '1' position, '5' static
+        types = [message.split(",")[5][0] for message in self.service.sent]
+        self.service.sent.clear()
+        return types
+
+    def test_static_data_sent_every_static_interval(self):
+        self.manager.update_vessels(1000.0, self.service)
+        self.assertEqual(self.sent_types(), [])
+
+        self.manager.update_vessels(1010.0, self.service)
+        self.assertEqual(self.sent_types(), ["1", "5"])
+
+        for current_time in (1020.0, 1030.0, 1060.0):
+            self.manager.update_vessels(current_time, self.service)
+            self.assertEqual(self.sent_types(), ["1"])
+
+        self.manager.update_vessels(1070.0, self.service)
+        self.assertEqual(self.sent_types(), ["1", "5"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+import numpy as np
+
+from nmea_simulator.models.ais_vessel import (
+    AISVessel,
+    advance_position,
+    advance_positions,
+)
+
+
+class TestAISVessel(unittest.TestCase):
+    def setUp(self):
+        self.vessel = AISVessel(
+            mmsi=366999001,
+            vessel_name="PACIFIC TRADER",
+            position={"lat": 37.8, "lon": -122.45},
+            course=245.3,
+            speed=12.7,
+        )
+
+    def test_static_data_sentence(self):
+        self.assertEqual(
+            self.vessel.generate_static_data(),
+            "!AIVDM,1,1,,A,55Mwmn@00001KWWW33504<THT>1A84@E:2222216<QT??N"
+            "888888888888888888880,0*38",
+        )
+
+    def test_static_data_cache_invalidated_on_change(self):
+        before = self.vessel.generate_static_data()
+        self.vessel.vessel_name = "EASTERN STAR"
+        after = self.vessel.generate_static_data()
+
+        expected = AISVessel(
+            mmsi=366999001,
+            vessel_name="EASTERN STAR",
+            position={"lat": 37.8, "lon": -122.45},
+        ).generate_static_data()
+        self.assertNotEqual(before, after)
+        self.assertEqual(after, expected)
+
+    def test_position_report_uses_given_timestamp(self):
+        payload = self.vessel.encode_position_report(timestamp=42)
+        bits = "".join(
+            format(ord(c) - 48 if ord(c) < 88 else ord(c) - 56, "06b") for c in payload
+        )
+        # Time stamp field sits at bits 137-142 of a Type 1 message
+        self.assertEqual(int(bits[137:143], 2), 42)
+        self.assertEqual(int(bits[8:38], 2), 366999001)
+
+
+class TestAdvancePositions(unittest.TestCase):
+    def test_matches_update_position(self):
+        vessels = [
+            AISVessel(
+                mmsi=366999001 + i,
+                vessel_name=f"VESSEL {i}",
+                position={"lat": lat, "lon": lon},
+                course=course,
+                speed=speed,
+            )
+            for i, (lat, lon, course, speed) in enumerate(
+                [
+                    (37.8, -122.45, 245.3, 12.7),
+                    (-33.9, 151.2, 10.0, 0.0),
+                    (60.1, 179.999, 90.0, 25.0),
+                    (89.999, -10.0, 0.0, 15.0),
+                ]
+            )
+        ]
+        lats, lons = advance_positions(
+            np.array([v.position["lat"] for v in vessels]),
+            np.array([v.position["lon"] for v in vessels]),
+            np.array([v.course for v in vessels]),
+            np.array([v.speed for v in vessels]),
+            10.0,
+        )
+        for vessel, lat, lon in zip(vessels, lats, lons):
+            vessel.update_position(10.0)
+            self.assertAlmostEqual(lat, vessel.position["lat"], places=9)
+            self.assertAlmostEqual(lon, vessel.position["lon"], places=9)
+
+    def test_scalar_wraps_across_antimeridian(self):
+        lat, lon = advance_position(0.0, 179.9999, 90.0, 20.0, 60.0)
+        self.assertAlmostEqual(lat, 0.0)
+        self.assertAlmostEqual(lon, -179.9945, places=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from functools import reduce
+from operator import xor
+
+from nmea_simulator.utils.checksum_utils import sentence_checksum, xor_checksum
+
+
+class TestXorChecksum(unittest.TestCase):
+    def test_matches_bytewise_xor(self):
+        sentence = (
+            b"GPRMC,123519.00,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W,,A"
+        )
+        for length in range(len(sentence) + 1):
+            data = sentence[:length]
+            self.assertEqual(xor_checksum(data), reduce(xor, data, 0))
+
+    def test_continues_from_checksum(self):
+        self.assertEqual(xor_checksum(b"GPHDT,123.4,T"), 0x31)
+        data = bytes(range(100))
+        self.assertEqual(
+            xor_checksum(data[40:], xor_checksum(data[:40])), xor_checksum(data)
+        )
+
+
+class TestSentenceChecksum(unittest.TestCase):
+    def test_covers_characters_between_start_and_star(self):
+        self.assertEqual(sentence_checksum("$GPHDT,123.4,T"), "31")
+        self.assertEqual(sentence_checksum("$GPHDT,123.4,T*31"), "31")
+        self.assertEqual(
+            sentence_checksum("!AIVDM,1,1,,A,0,0*"),
+            "%02X" % xor_checksum(b"AIVDM,1,1,,A,0,0"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
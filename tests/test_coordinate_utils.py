@@ -0,0 +1,70 @@
+import unittest
+
+from nmea_simulator.utils.coordinate_utils import (
+    calculate_bearing,
+    calculate_cross_track_error,
+    calculate_distance,
+    calculate_distance_and_bearing,
+    calculate_leg_geometry,
+    calculate_leg_navigation,
+    parse_coordinate,
+)
+
+
+class TestParseCoordinate(unittest.TestCase):
+    def test_numeric(self):
+        self.assertEqual(parse_coordinate(37), 37.0)
+        self.assertEqual(parse_coordinate("-122.45"), -122.45)
+
+    def test_directional(self):
+        self.assertEqual(parse_coordinate("122° W"), -122.0)
+        self.assertEqual(parse_coordinate("122 W"), -122.0)
+        self.assertEqual(parse_coordinate("37.5N"), 37.5)
+
+    def test_degrees_decimal_minutes(self):
+        self.assertAlmostEqual(parse_coordinate("37° 40.3574' N"), 37.67262333)
+        self.assertAlmostEqual(parse_coordinate("37 40.3574 S"), -37.67262333)
+        self.assertAlmostEqual(parse_coordinate("122 30E"), 122.5)
+
+    def test_invalid(self):
+        for coord in ["", "N", "abc", "37 40 30 N", "37.5 40 N", "37 -40 N"]:
+            with self.assertRaises(ValueError):
+                parse_coordinate(coord)
+
+    def test_rejects_non_decimal_numbers(self):
+        # float() accepts these, the directional formats must not
+        for coord in ["nan N", "inf E", "1e3 S", "+5 N", ".5 N", "37 4e1 N"]:
+            with self.assertRaises(ValueError):
+                parse_coordinate(coord)
+
+
+class TestDistanceAndBearing(unittest.TestCase):
+    def test_matches_separate_calculations(self):
+        for points in [
+            (37.8, -122.45, 37.9, -122.5),
+            (-33.9, 151.2, 51.5, -0.1),
+            (10.0, 179.9, 10.0, -179.9),
+        ]:
+            self.assertEqual(
+                calculate_distance_and_bearing(*points),
+                (calculate_distance(*points), calculate_bearing(*points)),
+            )
+
+
+class TestLegNavigation(unittest.TestCase):
+    def test_matches_separate_calculations(self):
+        start, end = (37.8, -122.45), (37.9, -122.5)
+        leg = calculate_leg_geometry(*start, *end)
+        for position in [(37.81, -122.46), (37.85, -122.44), (37.9, -122.5)]:
+            self.assertEqual(
+                calculate_leg_navigation(*position, leg),
+                (
+                    calculate_distance(*position, *end),
+                    calculate_bearing(*position, *end),
+                    *calculate_cross_track_error(*position, *start, *end),
+                ),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import socket
+import unittest
+from unittest import mock
+
+from nmea_simulator.models.route import Position, RouteManager
+from nmea_simulator.services.message_service import (
+    MessageService,
+    TransportProtocol,
+)
+
+
+class TestMessageServiceBatching(unittest.TestCase):
+    def setUp(self):
+        self.receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.receiver.bind(("127.0.0.1", 0))
+        self.receiver.settimeout(1.0)
+        self.service = MessageService(
+            host="127.0.0.1", port=self.receiver.getsockname()[1]
+        )
+
+    def tearDown(self):
+        self.service.close()
+        self.receiver.close()
+
+    def receive_all(self):
+        datagrams = []
+        self.receiver.settimeout(0.2)
+        try:
+            while True:
+                datagrams.append(self.receiver.recv(65535))
+        except socket.timeout:
+            pass
+        return datagrams
+
+    def test_unbatched_sends_one_datagram_per_sentence(self):
+        self.service.send_dbt(10.0)
+        self.service.send_rsa(5.0)
+        datagrams = self.receive_all()
+        self.assertEqual(len(datagrams), 2)
+        self.assertTrue(datagrams[0].startswith(b"$GPDBT,"))
+        self.assertTrue(datagrams[1].startswith(b"$GPRSA,"))
+
+    def test_batch_sends_single_datagram(self):
+        with self.service.batch():
+            self.service.send_dbt(10.0)
+            self.service.send_rsa(5.0)
+            self.assertEqual(self.receive_all(), [])
+        datagrams = self.receive_all()
+        self.assertEqual(len(datagrams), 1)
+        lines = datagrams[0].split(b"\r\n")
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith(b"$GPDBT,"))
+        self.assertTrue(lines[1].startswith(b"$GPRSA,"))
+        self.assertEqual(lines[2], b"")
+
+    def test_batch_splits_at_max_batch_size(self):
+        self.service.max_batch_size = 100
+        with self.service.batch():
+            for _ in range(10):
+                self.service.send_dbt(10.0)
+        datagrams = self.receive_all()
+        self.assertGreater(len(datagrams), 1)
+        for datagram in datagrams:
+            self.assertLessEqual(len(datagram), 100)
+            self.assertTrue(datagram.endswith(b"\r\n"))
+        self.assertEqual(b"".join(datagrams).count(b"$GPDBT,"), 10)
+
+    def test_flush_tx_sends_queued_messages(self):
+        with self.service.batch():
+            self.service.send_dbt(10.0)
+            self.service.flush_tx()
+            self.assertEqual(len(self.receive_all()), 1)
+            self.service.send_rsa(5.0)
+        datagrams = self.receive_all()
+        self.assertEqual(len(datagrams), 1)
+        self.assertTrue(datagrams[0].startswith(b"$GPRSA,"))
+
+    def test_full_send_buffer_drops_datagram(self):
+        sock = self.service.sock
+        self.service.sock = mock.Mock(spec=sock)
+        self.service.sock.sendto.side_effect = BlockingIOError
+        try:
+            with self.assertLogs(level="WARNING") as logs:
+                self.service.send_dbt(10.0)
+                self.service.send_rsa(5.0)
+        finally:
+            self.service.sock = sock
+        self.assertEqual(self.service.dropped_datagrams, 2)
+        self.assertEqual(len(logs.records), 1)
+
+    def test_rmb_without_active_waypoint(self):
+        self.service.send_rmb(RouteManager(), Position(37.8, -122.45), 5.0)
+        datagrams = self.receive_all()
+        # Status, 11 empty fields, then arrival status and mode indicator
+        self.assertEqual(datagrams, [b"$GPRMB,A,,,,,,,,,,,,V,N*13\r\n"])
+
+
+class TestMessageServiceInit(unittest.TestCase):
+    def test_unsupported_version_does_not_open_socket(self):
+        with mock.patch(
+            "nmea_simulator.services.message_service.socket"
+        ) as socket_factory:
+            with self.assertRaises(ValueError):
+                MessageService(
+                    network_protocol=TransportProtocol.TCP,
+                    nmea_version="0183",
+                )
+        socket_factory.assert_not_called()
+
+
+class TestSentenceFilter(unittest.TestCase):
+    def setUp(self):
+        self.service = MessageService(exclude_sentences=["HDG"])
+
+    def tearDown(self):
+        self.service.close()
+
+    def test_excluded_sentence_types(self):
+        for message in ("GPHDG,1", "$GPHDG,1", b"GPHDG,1", b"$GPHDG,1"):
+            self.assertFalse(self.service._should_send_sentence(message))
+        for message in ("GPHDT,1", "$GPHDT,1", b"GPHDT,1", b"$GPHDT,1"):
+            self.assertTrue(self.service._should_send_sentence(message))
+
+    def test_malformed_headers_are_not_sent(self):
+        for message in ("", "$GP", "gphdt,1", b"GP1DT,1", "!AIVDM,1"):
+            self.assertFalse(self.service._should_send_sentence(message))
+
+
+if __name__ == "__main__":
+    unittest.main()
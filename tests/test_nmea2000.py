@@ -4,7 +4,10 @@ import struct
 import math
 from datetime import datetime
 from nmea_simulator.services.nmea2000 import NMEA2000Message, NMEA2000Formatter, PGN
-from nmea_simulator.services.nmea2000.converter import NMEA2000Converter
+from nmea_simulator.services.nmea2000.converter import (
+    NMEA2000Converter,
+    _parse_ddmm_e7,
+)
 from nmea_simulator.services.nmea2000.utils import (
     encode_angle,
     decode_angle,
@@ -301,5 +304,43 @@ class TestNMEA2000Messages(unittest.TestCase):
         self.assertAlmostEqual(decoded_angle, wind_angle, places=2)
 
 
+class TestCoordinateParsing(unittest.TestCase):
+    def setUp(self):
+        self.converter = NMEA2000Converter()
+
+    def test_parse_ddmm_e7(self):
+        self.assertEqual(_parse_ddmm_e7("4807.038", "N"), 481173000)
+        self.assertEqual(_parse_ddmm_e7("01131.000", "W"), -115166666)
+        self.assertEqual(_parse_ddmm_e7("3346", "S"), -337666666)
+        self.assertEqual(_parse_ddmm_e7("0000.00000059", "N"), 0)
+        with self.assertRaises(ValueError):
+            _parse_ddmm_e7("", "N")
+
+    def test_rmc_invalid_position_sent_as_zero(self):
+        messages = self.converter.convert_rmc_to_2000(
+            "GPRMC,120000.00,A,x,N,01131.000,E,5,10,150626,,,,A"
+        )
+        self.assertEqual(messages[1].data, bytes(8))
+
+    def test_waypoint_coordinates(self):
+        self.assertAlmostEqual(
+            self.converter._parse_nmea_lat("3346.5", "S"), -33.775, places=9
+        )
+        self.assertAlmostEqual(
+            self.converter._parse_nmea_lon("15112", "E"), 151.2, places=9
+        )
+        self.assertAlmostEqual(
+            self.converter._parse_nmea_lat("4807.", "N"), 48.1166666667, places=9
+        )
+        self.assertEqual(self.converter._parse_nmea_lon("", "E"), 0.0)
+
+    def test_position_is_not_truncated_below_exact_value(self):
+        message = self.converter.convert_gga_to_2000(
+            "GPGGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,"
+        )
+        lat_raw = struct.unpack_from("<q", message.data, 4)[0]
+        self.assertEqual(lat_raw, 481173000)
+
+
 if __name__ == "__main__":
     unittest.main()
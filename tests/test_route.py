@@ -0,0 +1,85 @@
+import unittest
+
+from nmea_simulator.models.route import Position, RouteManager
+from nmea_simulator.utils.coordinate_utils import calculate_bearing, calculate_distance
+
+
+class TestRouteManager(unittest.TestCase):
+    def setUp(self):
+        self.route = RouteManager()
+        self.route.set_waypoints(
+            [
+                {"lat": 37.8, "lon": -122.45},
+                {"lat": 37.9, "lon": -122.5},
+                {"lat": 38.0, "lon": -122.4},
+            ]
+        )
+
+    def test_range_and_bearing(self):
+        position = Position(lat=37.81, lon=-122.46)
+        distance, bearing = self.route.get_range_and_bearing(position)
+        self.assertEqual(distance, calculate_distance(37.81, -122.46, 37.9, -122.5))
+        self.assertEqual(bearing, calculate_bearing(37.81, -122.46, 37.9, -122.5))
+
+    def test_range_and_bearing_follows_waypoint_change(self):
+        position = Position(lat=37.81, lon=-122.46)
+        before = self.route.get_range_and_bearing(position)
+        self.route.current_index = 2
+        after = self.route.get_range_and_bearing(position)
+        self.assertNotEqual(before, after)
+        self.assertEqual(after[0], calculate_distance(37.81, -122.46, 38.0, -122.4))
+
+    def test_current_segment_uses_leg_bearing(self):
+        segment = self.route.get_current_segment()
+        self.assertAlmostEqual(
+            segment.bearing, calculate_bearing(37.8, -122.45, 37.9, -122.5)
+        )
+        self.assertAlmostEqual(
+            segment.distance, calculate_distance(37.8, -122.45, 37.9, -122.5)
+        )
+        self.assertIs(self.route.get_current_segment(), segment)
+
+    def test_update_progress_advances_at_waypoint(self):
+        self.assertTrue(self.route.update_progress(37.9, -122.5))
+        self.assertEqual(self.route.current_index, 2)
+        self.assertEqual(self.route.get_current_segment().end.lat, 38.0)
+
+    def test_update_course_skips_reached_waypoints(self):
+        route = RouteManager(waypoint_threshold=0.5)
+        route.set_waypoints(
+            [
+                {"lat": 37.8, "lon": -122.45},
+                {"lat": 37.8001, "lon": -122.45},
+                {"lat": 38.0, "lon": -122.4},
+            ]
+        )
+        position = Position(lat=37.8, lon=-122.45)
+        self.assertEqual(
+            route.update_course_to_waypoint(position),
+            (True, calculate_bearing(37.8, -122.45, 38.0, -122.4)),
+        )
+        self.assertEqual(route.current_index, 2)
+
+    def test_update_course_with_all_waypoints_reached(self):
+        route = RouteManager()
+        route.set_waypoints([{"lat": 37.8, "lon": -122.45}] * 3)
+        continue_navigation, _ = route.update_course_to_waypoint(
+            Position(lat=37.8, lon=-122.45)
+        )
+        self.assertTrue(continue_navigation)
+
+    def test_update_course_with_single_waypoint_reached(self):
+        route = RouteManager()
+        route.set_waypoints([{"lat": 37.8, "lon": -122.45}])
+        continue_navigation, course = route.update_course_to_waypoint(
+            Position(lat=37.8005, lon=-122.45)
+        )
+        self.assertTrue(continue_navigation)
+        self.assertAlmostEqual(
+            course, calculate_bearing(37.8005, -122.45, 37.8, -122.45)
+        )
+        self.assertEqual(route.current_index, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,17 @@
+import unittest
+from datetime import timedelta
+
+from nmea_simulator.models.speed_profile import SpeedManager
+
+
+class TestSpeedManager(unittest.TestCase):
+    def test_segments_advance_after_duration(self):
+        manager = SpeedManager()
+        manager.set_speed_profile([(timedelta(seconds=2), 5.0), (None, 8.0)])
+        speeds = [manager.update_speed(t) for t in (0.0, 1.0, 2.0, 3.0, 1000.0)]
+        self.assertEqual(speeds, [5.0, 5.0, 8.0, 8.0, 8.0])
+        self.assertEqual(manager.current_segment.speed, 8.0)
+
+
+if __name__ == "__main__":
+    unittest.main()